@@ -3,6 +3,7 @@ Configuration file for OHLCV Data Ingestion System
 """
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # =========================
 # PATHS
@@ -14,6 +15,15 @@ SERVICE_ACCOUNT_PATH = CREDENTIALS_DIR / "ohlcv-486219-a5b71eb1ae70.json"
 # Local storage directory
 LOCAL_DATA_DIR = BASE_DIR / "data"
 
+# Number of parsed CSV files kept in memory (reused until the file changes)
+LOCAL_CSV_CACHE_SIZE = 8
+
+# CSV files loaded concurrently for upload
+LOCAL_CSV_MAX_CONCURRENT_LOADS = 4
+
+# Cache of completed Coinbase pagination chunks (raw candle arrays)
+CANDLE_CACHE_DIR = LOCAL_DATA_DIR / "cache" / "coinbase"
+
 # =========================
 # GOOGLE DRIVE CONFIG
 # =========================
@@ -26,6 +36,12 @@ GOOGLE_SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# OAuth tokens are refreshed in the background this long before they expire;
+# failed refreshes are retried after a delay that doubles up to the maximum
+OAUTH_REFRESH_MARGIN_SECONDS = 300
+OAUTH_REFRESH_RETRY_SECONDS = 30
+OAUTH_REFRESH_RETRY_MAX_SECONDS = 600
+
 # =========================
 # DATA SCHEMA
 # =========================
@@ -39,6 +55,9 @@ REQUIRED_COLUMNS = [
     "symbol",
 ]
 
+# Same columns as a set, for membership checks
+REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
+
 # =========================
 # API CONFIG
 # =========================
@@ -48,36 +67,43 @@ EXCHANGE_API_TIMEFRAMES = ["5m", "1h", "6h", "1d"]
 
 # Advanced Trade API required timeframes
 ADVANCED_TRADE_TIMEFRAMES = ["30m"]
+ADVANCED_TRADE_TIMEFRAMES_SET = frozenset(ADVANCED_TRADE_TIMEFRAMES)
 
 # Aggregated timeframes (created from daily data)
 AGGREGATED_TIMEFRAMES = ["1w"]
+AGGREGATED_TIMEFRAMES_SET = frozenset(AGGREGATED_TIMEFRAMES)
+
+# Timeframe table: (timeframe, granularity in seconds, worksheet name)
+TIMEFRAME_TABLE = (
+    ("5m", 300, "M5"),
+    ("30m", 1800, "M30"),
+    ("1h", 3600, "H1"),
+    ("6h", 21600, "H6"),
+    ("1d", 86400, "D1"),
+    ("1w", 604800, "W1"),  # 7 days
+)
 
-# All available timeframes
-ALL_TIMEFRAMES = ["5m", "30m", "1h", "6h", "1d", "1w"]
-
-# Granularity mapping (in seconds)
-GRANULARITY_MAP = {
-    "5m": 300,
-    "30m": 1800,
-    "1h": 3600,
-    "6h": 21600,
-    "1d": 86400,
-    "1w": 604800,  # 7 days
-}
-
-TF_SHEET_NAMES = {
-    "5m": "M5",
-    "30m": "M30",
-    "1h": "H1",
-    "6h": "H6",
-    "1d": "D1",
-    "1w": "W1",
-}
+# All available timeframes (in display order, and as a set for membership checks)
+ALL_TIMEFRAMES = [tf for tf, _, _ in TIMEFRAME_TABLE]
+ALL_TIMEFRAMES_SET = frozenset(ALL_TIMEFRAMES)
+
+# Granularity mapping (in seconds), read-only
+GRANULARITY_MAP = MappingProxyType({tf: seconds for tf, seconds, _ in TIMEFRAME_TABLE})
+
+# Worksheet name per timeframe, read-only
+TF_SHEET_NAMES = MappingProxyType({tf: name for tf, _, name in TIMEFRAME_TABLE})
 
 COINBASE_BASE_URL = "https://api.exchange.coinbase.com"
 COINBASE_ADVANCED_TRADE_URL = "https://api.coinbase.com/api/v3/brokerage"
 API_TIMEOUT = 10  # seconds
 
+# Request rate budgets (requests per second) and concurrent requests in flight
+COINBASE_EXCHANGE_REQUESTS_PER_SECOND = 5
+COINBASE_ADVANCED_REQUESTS_PER_SECOND = 3
+COINBASE_MAX_CONCURRENT_REQUESTS = 5
+COINBASE_MAX_CONCURRENT_SYMBOLS = 4
+COINBASE_MAX_CONCURRENT_TIMEFRAMES = 4
+
 # =========================
 # PAGINATION CONFIG
 # =========================
@@ -90,6 +116,13 @@ MAX_CANDLES_PER_REQUEST = 300
 DEFAULT_SHEET_ROWS = 5000
 DEFAULT_SHEET_COLS = 20
 
+# Maximum spreadsheets written concurrently by append_all
+# (kept low to stay within Sheets API per-user write quota)
+MAX_CONCURRENT_SHEET_WRITES = 10
+
+# Sheets API write quota (requests per minute per user)
+SHEETS_WRITE_REQUESTS_PER_MINUTE = 60
+
 # =========================
 # LOGGING CONFIG
 # =========================
@@ -1,17 +1,34 @@
 """Sheet management package"""
-from .sheets import (
-    get_or_create_spreadsheet_in_folder,
-    ensure_timeframe_tables,
-    append_ohlcv_dataframe,
-    get_spreadsheet_url,
-)
-from .data_manager import rest_to_dataframe, validate_dataframe
+from .data_manager import rest_to_dataframe, validate_dataframe, format_timestamps, to_utc_timestamps
+
+# Sheets helpers pull in the Google client libraries, so they are imported
+# on first access (importing drive.data_manager alone stays cheap)
+_SHEETS_EXPORTS = frozenset({
+    'get_or_create_spreadsheet_in_folder',
+    'ensure_timeframe_tables',
+    'append_ohlcv_dataframe',
+    'append_many',
+    'append_all',
+    'get_spreadsheet_url',
+})
+
+
+def __getattr__(name):
+    if name in _SHEETS_EXPORTS:
+        from . import sheets
+        return getattr(sheets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'get_or_create_spreadsheet_in_folder',
     'ensure_timeframe_tables',
     'append_ohlcv_dataframe',
+    'append_many',
+    'append_all',
     'get_spreadsheet_url',
     'rest_to_dataframe',
     'validate_dataframe',
+    'format_timestamps',
+    'to_utc_timestamps',
 ]
\ No newline at end of file
@@ -2,9 +2,10 @@
 Data transformation and validation module
 Converts API responses to clean pandas DataFrames
 """
+import numpy as np
 import pandas as pd
 from typing import List, Dict
-from config.config import REQUIRED_COLUMNS
+from config.config import REQUIRED_COLUMNS, REQUIRED_COLUMNS_SET
 from utils.logger import setup_logger
 from utils.exceptions import DataValidationException
 
@@ -35,86 +36,224 @@ def rest_to_dataframe(data: List[Dict]) -> pd.DataFrame:
         )
 
     try:
-        df = pd.DataFrame(data)
+        df = _build_frame(data)
     except Exception as e:
         raise DataValidationException(
             f"Failed to create DataFrame: {str(e)}"
         )
 
     # Ensure all required columns exist
-    missing_cols = set(REQUIRED_COLUMNS) - set(df.columns)
+    missing_cols = REQUIRED_COLUMNS_SET.difference(df.columns)
     if missing_cols:
         raise DataValidationException(
             f"Missing required columns: {missing_cols}"
         )
 
-    # Keep only required columns in correct order
-    df = df[REQUIRED_COLUMNS].copy()
+    # Keep only required columns in correct order (the new frame is already
+    # private to this function, so no copy is needed when nothing changes)
+    if list(df.columns) != REQUIRED_COLUMNS:
+        df = df[REQUIRED_COLUMNS].copy()
 
     # Convert timestamp to datetime (UTC-safe)
     try:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        df["timestamp"] = to_utc_timestamps(df["timestamp"])
     except Exception as e:
         raise DataValidationException(
             f"Failed to parse timestamps: {str(e)}"
         )
 
     # Enforce numeric types for OHLCV values
+    # Exchange payloads are usually numeric already, so only coerce the rest
     numeric_cols = ["open", "high", "low", "close", "volume"]
     for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+        if not (
+            pd.api.types.is_float_dtype(df[col])
+            or pd.api.types.is_integer_dtype(df[col])
+        ):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # Build one validity mask over all OHLCV values
+    invalid_numeric = np.isnan(df[numeric_cols].to_numpy(dtype=np.float64)).any(axis=1)
 
     # Count rows with invalid data before dropping
-    invalid_rows = df[numeric_cols].isnull().any(axis=1).sum()
+    invalid_rows = int(invalid_numeric.sum())
     if invalid_rows > 0:
         logger.warning(f"Dropping {invalid_rows} rows with invalid numeric data")
 
     # Drop rows with any NaN values
-    df = df.dropna()
+    valid = ~invalid_numeric & df["timestamp"].notna().to_numpy() & df["symbol"].notna().to_numpy()
+    if not valid.all():
+        df = df[valid]
 
     if df.empty:
         logger.warning("All rows were invalid, returning empty DataFrame")
         return pd.DataFrame(columns=REQUIRED_COLUMNS)
 
-    # Deduplicate by timestamp and symbol
+    # Deduplicate by timestamp and symbol, then sort chronologically
     initial_count = len(df)
-    df = df.drop_duplicates(subset=["timestamp", "symbol"], keep="last")
+    df = _sort_and_deduplicate(df)
     duplicates_removed = initial_count - len(df)
     
     if duplicates_removed > 0:
         logger.info(f"Removed {duplicates_removed} duplicate rows")
 
-    # Sort chronologically
-    df = df.sort_values("timestamp").reset_index(drop=True)
-
     logger.info(f"DataFrame created with {len(df)} valid rows")
     return df
 
 
+def _build_frame(data: List[Dict]) -> pd.DataFrame:
+    """
+    Build a DataFrame from OHLCV dictionaries using the fixed schema
+    Columns are gathered directly and OHLCV values are parsed straight into
+    float64 arrays, skipping the generic dtype-inferring constructor; rows
+    with missing keys fall back to it so validation reports the problem
+
+    Args:
+        data: List of OHLCV dictionaries
+
+    Returns:
+        DataFrame with REQUIRED_COLUMNS (plus extra keys on fallback)
+    """
+    try:
+        columns = {col: [row[col] for row in data] for col in REQUIRED_COLUMNS}
+    except (KeyError, TypeError):
+        return pd.DataFrame(data)
+
+    for col in ("open", "high", "low", "close", "volume"):
+        try:
+            columns[col] = np.fromiter(columns[col], dtype=np.float64, count=len(data))
+        except (TypeError, ValueError):
+            # Left as-is; invalid values are coerced to NaN and dropped later
+            pass
+
+    return pd.DataFrame(columns)
+
+
+def to_utc_timestamps(timestamps: pd.Series) -> pd.Series:
+    """
+    Convert timestamps to timezone-aware UTC datetimes
+    Datetime input is only localized/converted, numeric input is treated as
+    Unix epoch seconds, and strings are parsed as ISO 8601 without per-row
+    format inference
+
+    Args:
+        timestamps: Series of datetimes, epoch seconds or ISO 8601 strings
+
+    Returns:
+        Series of UTC datetimes
+    """
+    if isinstance(timestamps.dtype, pd.DatetimeTZDtype):
+        return timestamps.dt.tz_convert("UTC")
+    if pd.api.types.is_datetime64_dtype(timestamps):
+        return timestamps.dt.tz_localize("UTC")
+    if pd.api.types.is_numeric_dtype(timestamps):
+        return pd.to_datetime(timestamps, unit="s", utc=True)
+    return pd.to_datetime(timestamps, utc=True, format="ISO8601", cache=True)
+
+
+def _sort_and_deduplicate(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort rows by timestamp and drop duplicate (timestamp, symbol) rows,
+    keeping the last occurrence
+    A response normally holds a single symbol, so deduplication reduces to
+    one stable int64 argsort and keeping the last row of each timestamp run
+
+    Args:
+        df: DataFrame with parsed UTC timestamps
+
+    Returns:
+        Sorted, deduplicated DataFrame with a fresh index
+    """
+    symbols = df["symbol"]
+    if not (symbols == symbols.iloc[0]).all():
+        df = df.drop_duplicates(subset=["timestamp", "symbol"], keep="last")
+        return df.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+    ts = df["timestamp"].values.view("i8")
+    order = np.argsort(ts, kind="stable")
+    sorted_ts = ts[order]
+
+    # Duplicates are adjacent and in original order after a stable sort
+    last_of_run = np.empty(len(sorted_ts), dtype=bool)
+    last_of_run[:-1] = sorted_ts[1:] != sorted_ts[:-1]
+    last_of_run[-1:] = True
+
+    return df.iloc[order[last_of_run]].reset_index(drop=True)
+
+
+def format_timestamps(timestamps: pd.Series, suffix: str = "Z") -> np.ndarray:
+    """
+    Format UTC timestamps as ISO 8601 strings with second precision
+    Formatting runs as a single NumPy call instead of a per-row strftime
+
+    Args:
+        timestamps: Series of timezone-aware (UTC) datetimes
+        suffix: Timezone designator appended to each string (default: 'Z')
+
+    Returns:
+        NumPy array of strings, e.g. '2024-01-01T00:00:00Z'
+    """
+    values = np.datetime_as_string(
+        timestamps.values.astype("datetime64[s]"), unit="s"
+    )
+    return np.char.add(values, suffix)
+
+
 def validate_dataframe(df: pd.DataFrame) -> bool:
     
     if df.empty:
         raise DataValidationException("DataFrame is empty")
     
     # Check columns
-    if not all(col in df.columns for col in REQUIRED_COLUMNS):
-        missing = set(REQUIRED_COLUMNS) - set(df.columns)
+    missing = REQUIRED_COLUMNS_SET.difference(df.columns)
+    if missing:
         raise DataValidationException(f"Missing columns: {missing}")
     
-    # Check for nulls
-    if df.isnull().any().any():
+    # Check for nulls (one NumPy pass over the OHLCV block)
+    try:
+        ohlcv = df[["open", "high", "low", "close", "volume"]].to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        raise DataValidationException("DataFrame contains non-numeric OHLCV values")
+    if (
+        np.isnan(ohlcv).any()
+        or df["timestamp"].isna().any()
+        or df["symbol"].isna().any()
+    ):
         raise DataValidationException("DataFrame contains null values")
     
-    # Validate OHLC relationships
-    invalid_ohlc = (
-        (df["high"] < df["low"]) |
-        (df["high"] < df["open"]) |
-        (df["high"] < df["close"]) |
-        (df["low"] > df["open"]) |
-        (df["low"] > df["close"])
-    ).any()
+    # Validate OHLC relationships and volumes
+    bad_row = _first_invalid_ohlcv(
+        ohlcv[:, 0], ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4]
+    )
     
-    if invalid_ohlc:
-        raise DataValidationException("Invalid OHLC relationships detected")
+    if bad_row >= 0:
+        raise DataValidationException(
+            f"Invalid OHLCV values detected (first at row {bad_row}, "
+            f"timestamp {df['timestamp'].iloc[bad_row]})"
+        )
     
     return True
+
+
+def _first_invalid_ohlcv(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> int:
+    """
+    Find the first row whose high/low do not bound its open and close,
+    or whose volume is negative
+    high >= max(open, close) and low <= min(open, close) together imply
+    high >= low, so two comparisons cover all five OHLC rules
+
+    Returns:
+        Index of the first invalid row, or -1 if all rows are valid
+    """
+    body_top = np.maximum(open_, close)
+    body_bottom = np.minimum(open_, close)
+    invalid = (high < body_top) | (low > body_bottom) | (volume < 0)
+    if not invalid.any():
+        return -1
+    return int(invalid.argmax())
@@ -3,28 +3,53 @@ Google Sheets Manager
 Handles all Google Sheets and Drive operations with improved error handling
 """
 import gspread
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+from gspread.urls import SPREADSHEET_BATCH_UPDATE_URL
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.oauth2.service_account import Credentials
-import time
 
 from config.config import (
     REQUIRED_COLUMNS,
+    REQUIRED_COLUMNS_SET,
     TF_SHEET_NAMES,
     GOOGLE_SCOPES,
     DEFAULT_SHEET_ROWS,
     DEFAULT_SHEET_COLS,
+    MAX_CONCURRENT_SHEET_WRITES,
+    SHEETS_WRITE_REQUESTS_PER_MINUTE,
 )
+from drive.data_manager import format_timestamps, to_utc_timestamps
 from utils.logger import setup_logger
 from utils.exceptions import GoogleSheetsException, StorageQuotaException
+from utils.rate_limit import TokenBucket, call_with_backoff
 
 logger = setup_logger(__name__)
 
+# orjson encodes large cell payloads much faster; fall back to gspread's encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# (spreadsheet_id, worksheet title) -> (timestamp column, rows read, sorted epoch seconds)
+_TIMESTAMP_CACHE: Dict[Tuple[str, str], Tuple[int, int, np.ndarray]] = {}
 
+# Shared write limiter: bursts up to the per-minute quota, then paces
+_WRITE_LIMITER = TokenBucket(
+    rate=SHEETS_WRITE_REQUESTS_PER_MINUTE / 60,
+    capacity=SHEETS_WRITE_REQUESTS_PER_MINUTE,
+)
+
+# id(credentials) -> (credentials, drive service, sheets service)
+_SERVICES: Dict[int, Tuple[Credentials, Any, Any]] = {}
 
+# (id(client), folder_id, spreadsheet name) -> (client, spreadsheet)
+_SPREADSHEETS: Dict[Tuple[int, str, str], Tuple[gspread.Client, gspread.Spreadsheet]] = {}
 
 
 def get_or_create_spreadsheet_in_folder(
@@ -37,6 +62,7 @@ def get_or_create_spreadsheet_in_folder(
     """
     Create or retrieve spreadsheet in specified Drive folder
     Format: Exchange(pair) - e.g., Coinbase(BTC-USD)
+    The result is cached per client, so repeated calls skip the Drive search
     
     ULTIMATE WORKAROUND: Creates spreadsheet using Sheets API directly,
     completely bypassing Drive API to avoid service account quota bugs
@@ -55,28 +81,36 @@ def get_or_create_spreadsheet_in_folder(
         GoogleSheetsException: If creation/retrieval fails
     """
     spreadsheet_name = f"{exchange.capitalize()}({pair})"
+    cache_key = (id(client), folder_id, spreadsheet_name)
+    
+    cached = _SPREADSHEETS.get(cache_key)
+    if cached is not None and cached[0] is client:
+        return cached[1]
     
     try:
-        drive_service = build("drive", "v3", credentials=creds)
+        drive_service, sheets_service = _get_services(creds)
 
-        # Search for existing spreadsheet in folder
+        # Search for existing spreadsheet in folder (only the ID is needed)
         query = (
             f"mimeType='application/vnd.google-apps.spreadsheet' "
-            f"and name='{spreadsheet_name}' "
-            f"and '{folder_id}' in parents "
+            f"and name='{_escape_query_value(spreadsheet_name)}' "
+            f"and '{_escape_query_value(folder_id)}' in parents "
             f"and trashed=false"
         )
 
         results = drive_service.files().list(
             q=query,
-            fields="files(id, name, createdTime, size)"
+            fields="files(id)",
+            pageSize=1,
         ).execute()
 
         files = results.get("files", [])
 
         if files:
             logger.info(f"Found existing spreadsheet: {spreadsheet_name}")
-            return client.open_by_key(files[0]["id"])
+            spreadsheet = client.open_by_key(files[0]["id"])
+            _SPREADSHEETS[cache_key] = (client, spreadsheet)
+            return spreadsheet
 
         # ULTIMATE WORKAROUND: Use Sheets API directly instead of Drive API
         logger.info(f"Creating spreadsheet via Sheets API (bypassing Drive quota): {spreadsheet_name}")
@@ -84,9 +118,6 @@ def get_or_create_spreadsheet_in_folder(
         spreadsheet_id = None
         
         try:
-            from googleapiclient.discovery import build as api_build
-            sheets_service = api_build('sheets', 'v4', credentials=creds)
-            
             # Create spreadsheet using Sheets API directly
             spreadsheet_body = {
                 'properties': {
@@ -152,7 +183,9 @@ def get_or_create_spreadsheet_in_folder(
             logger.warning(f"You can manually move it to your folder in Drive")
         
         # Open with gspread
-        return client.open_by_key(spreadsheet_id)
+        spreadsheet = client.open_by_key(spreadsheet_id)
+        _SPREADSHEETS[cache_key] = (client, spreadsheet)
+        return spreadsheet
         
     except HttpError as e:
         # Enhanced error logging
@@ -171,10 +204,37 @@ def get_or_create_spreadsheet_in_folder(
         )
 
 
+def _escape_query_value(value: str) -> str:
+    """Escape a string literal for a Drive files.list query"""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def _get_services(creds: Credentials) -> Tuple[Any, Any]:
+    """
+    Get Drive v3 and Sheets v4 API services for credentials
+    Services are built once per credentials object and reused, so the
+    discovery document is only loaded and parsed on first use
+    
+    Args:
+        creds: Google credentials
+    
+    Returns:
+        Tuple of (drive service, sheets service)
+    """
+    cached = _SERVICES.get(id(creds))
+    if cached is not None and cached[0] is creds:
+        return cached[1], cached[2]
+
+    drive_service = build("drive", "v3", credentials=creds, cache_discovery=False)
+    sheets_service = build("sheets", "v4", credentials=creds, cache_discovery=False)
+    _SERVICES[id(creds)] = (creds, drive_service, sheets_service)
+    return drive_service, sheets_service
+
+
 def ensure_timeframe_tables(
     spreadsheet: gspread.Spreadsheet,
     timeframes: List[str],
-) -> None:
+) -> Dict[str, gspread.Worksheet]:
     """
     Ensure worksheets for each timeframe exist with proper headers
     Prevents duplicate creation
@@ -183,48 +243,71 @@ def ensure_timeframe_tables(
         spreadsheet: gspread Spreadsheet object
         timeframes: List of timeframes to create (e.g., ['1h', '4h'])
     
+    Returns:
+        Dictionary mapping worksheet name to Worksheet, for every timeframe
+        (saves a metadata request per spreadsheet.worksheet() lookup)
+    
     Raises:
         GoogleSheetsException: If worksheet creation fails
     """
     try:
-        existing_titles = {ws.title for ws in spreadsheet.worksheets()}
+        worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+        existing_titles = set(worksheets)
         logger.info(f"Existing worksheets: {existing_titles}")
 
+        tab_names = []
         for tf in timeframes:
             if tf not in TF_SHEET_NAMES:
                 raise ValueError(
                     f"Unsupported timeframe: {tf}. "
                     f"Supported: {', '.join(TF_SHEET_NAMES.keys())}"
                 )
+            if TF_SHEET_NAMES[tf] not in tab_names:
+                tab_names.append(TF_SHEET_NAMES[tf])
 
-            tab_name = TF_SHEET_NAMES[tf]
+        header_range = f"A1:{rowcol_to_a1(1, len(REQUIRED_COLUMNS))}"
+        header_updates = []
 
-            # Create worksheet if it doesn't exist
+        # Create missing worksheets; headers are written in the batch below
+        for tab_name in tab_names:
             if tab_name not in existing_titles:
                 logger.info(f"Creating worksheet: {tab_name}")
-                ws = spreadsheet.add_worksheet(
+                worksheets[tab_name] = spreadsheet.add_worksheet(
                     title=tab_name,
                     rows=DEFAULT_SHEET_ROWS,
                     cols=DEFAULT_SHEET_COLS,
                 )
-                ws.append_row(REQUIRED_COLUMNS)
-                logger.info(f"Created worksheet {tab_name} with headers")
-                continue
+                header_updates.append(
+                    {"range": absolute_range_name(tab_name, header_range), "values": [REQUIRED_COLUMNS]}
+                )
+
+        # Read the header row of every existing worksheet in one request
+        existing_tabs = [t for t in tab_names if t in existing_titles]
+        if existing_tabs:
+            response = spreadsheet.values_batch_get(
+                [absolute_range_name(t, header_range) for t in existing_tabs]
+            )
 
-            # If exists, verify header exists
-            ws = spreadsheet.worksheet(tab_name)
-            values = ws.get_all_values()
+            for tab_name, value_range in zip(existing_tabs, response.get("valueRanges", [])):
+                values = value_range.get("values", [])
 
-            if not values or values[0] != REQUIRED_COLUMNS:
-                logger.warning(f"Worksheet {tab_name} has incorrect/missing headers")
-                if not values:
-                    ws.append_row(REQUIRED_COLUMNS)
+                if not values or values[0] != REQUIRED_COLUMNS:
+                    logger.warning(f"Worksheet {tab_name} has incorrect/missing headers")
+                    header_updates.append(
+                        {"range": absolute_range_name(tab_name, header_range), "values": [REQUIRED_COLUMNS]}
+                    )
                 else:
-                    # Update first row with correct headers
-                    ws.update('A1', [REQUIRED_COLUMNS])
-                logger.info(f"Fixed headers for worksheet {tab_name}")
-            else:
-                logger.info(f"Worksheet {tab_name} already exists with correct headers")
+                    logger.info(f"Worksheet {tab_name} already exists with correct headers")
+
+        # Write all new/fixed headers in one request
+        if header_updates:
+            _sheets_write(
+                spreadsheet.values_batch_update,
+                {"valueInputOption": "RAW", "data": header_updates},
+            )
+            logger.info(f"Wrote headers for {len(header_updates)} worksheets")
+        
+        return {tab_name: worksheets[tab_name] for tab_name in tab_names}
                 
     except Exception as e:
         raise GoogleSheetsException(
@@ -236,18 +319,18 @@ def append_ohlcv_dataframe(
     worksheet: gspread.Worksheet,
     df: pd.DataFrame,
     index_col: str = "timestamp",
-    batch_size: int = 100,
+    batch_size: Optional[int] = None,
 ) -> int:
     """
     Append OHLCV DataFrame to worksheet with duplicate prevention
     Deduplication based on timestamp column
-    Data is appended in batches to avoid API limits
+    All new rows are sent in a single append request unless batch_size is set
     
     Args:
         worksheet: gspread Worksheet object
         df: Pandas DataFrame with OHLCV data
         index_col: Column name to use for deduplication (default: 'timestamp')
-        batch_size: Number of rows to append per batch (default: 100)
+        batch_size: Optional number of rows per append request (default: all rows in one request)
     
     Returns:
         Number of new rows appended
@@ -260,55 +343,35 @@ def append_ohlcv_dataframe(
         return 0
 
     try:
-        # Validate schema
-        missing = set(REQUIRED_COLUMNS) - set(df.columns)
-        if missing:
-            raise ValueError(f"Missing required columns: {missing}")
-
-        df = df[REQUIRED_COLUMNS].copy()
+        df = _normalize_for_sheet(df, index_col)
 
-        # Normalize timestamp to string (Sheets-compatible)
-        df[index_col] = (
-            pd.to_datetime(df[index_col], utc=True)
-            .dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-        )
+        # Get timestamps already stored in the worksheet
+        existing_timestamps = _existing_timestamps(worksheet, index_col)
 
-        # Get existing data
-        existing_values = worksheet.get_all_values()
-
-        # If only header or empty, append all data
-        if len(existing_values) <= 1:
-            logger.info("Worksheet is empty, appending all data in batches")
-            total_appended = _append_in_batches(worksheet, df, batch_size)
+        # If only header or empty, write all data in one bulk request
+        if not len(existing_timestamps) and not batch_size:
+            logger.info("Worksheet is empty, writing all data")
+            total_appended = _populate_empty(worksheet, _to_sheet_values(df, index_col))
+            _remember_appended(worksheet.spreadsheet.id, worksheet.title, df[index_col])
             return total_appended
 
-        # Extract existing timestamps for deduplication
-        header = existing_values[0]
-        try:
-            ts_idx = header.index(index_col)
-        except ValueError:
-            raise GoogleSheetsException(
-                f"Column '{index_col}' not found in worksheet header"
-            )
-
-        existing_timestamps = {
-            row[ts_idx]
-            for row in existing_values[1:]
-            if len(row) > ts_idx and row[ts_idx]
-        }
+        if not len(existing_timestamps):
+            logger.info("Worksheet is empty, appending all data")
+            new_df = df
+        else:
+            logger.info(f"Found {len(existing_timestamps)} existing timestamps")
 
-        logger.info(f"Found {len(existing_timestamps)} existing timestamps")
+            # Filter out duplicates
+            new_df = _drop_existing(df, index_col, existing_timestamps)
 
-        # Filter out duplicates
-        new_df = df[~df[index_col].isin(existing_timestamps)]
+            if new_df.empty:
+                logger.info("No new data to append (all duplicates)")
+                return 0
 
-        if new_df.empty:
-            logger.info("No new data to append (all duplicates)")
-            return 0
+            logger.info(f"Appending {len(new_df)} new rows")
 
-        # Append new rows in batches
-        logger.info(f"Appending {len(new_df)} new rows in batches of {batch_size}")
-        total_appended = _append_in_batches(worksheet, new_df, batch_size)
+        total_appended = _append_in_batches(worksheet, _to_sheet_values(new_df, index_col), batch_size)
+        _remember_appended(worksheet.spreadsheet.id, worksheet.title, new_df[index_col])
         
         return total_appended
         
@@ -333,19 +396,377 @@ def append_ohlcv_dataframe(
         )
 
 
+def append_many(
+    spreadsheet: gspread.Spreadsheet,
+    frames: Dict[str, pd.DataFrame],
+    index_col: str = "timestamp",
+    worksheets: Optional[Dict[str, gspread.Worksheet]] = None,
+) -> Dict[str, int]:
+    """
+    Append OHLCV DataFrames to several timeframe worksheets at once
+    Existing rows of all worksheets are read with one batchGet request and
+    all new rows are written with one batchUpdate (appendCells) request
+    
+    Args:
+        spreadsheet: gspread Spreadsheet object
+        frames: Mapping of timeframe (e.g., '1h') to OHLCV DataFrame
+        index_col: Column name to use for deduplication (default: 'timestamp')
+        worksheets: Optional mapping of tab name to Worksheet, as returned by
+                    ensure_timeframe_tables (saves listing the worksheets)
+    
+    Returns:
+        Mapping of timeframe to number of new rows appended
+    
+    Raises:
+        GoogleSheetsException: If append operation fails
+    """
+    frames = {tf: df for tf, df in frames.items() if not df.empty}
+    if not frames:
+        logger.warning("No data provided, nothing to append")
+        return {}
+
+    try:
+        if worksheets is None:
+            worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+        titles = {tf: TF_SHEET_NAMES[tf] for tf in frames}
+
+        missing_tabs = [t for t in titles.values() if t not in worksheets]
+        if missing_tabs:
+            raise ValueError(f"Worksheets not found: {', '.join(missing_tabs)}")
+
+        # Read the timestamp column of every target worksheet in a single
+        # request (only rows added since the last read for cached worksheets)
+        ts_col = REQUIRED_COLUMNS.index(index_col) + 1
+        cached = {tf: _TIMESTAMP_CACHE.get((spreadsheet.id, title)) for tf, title in titles.items()}
+        ranges = [
+            _column_range(title, ts_col, cached[tf][1] + 1 if cached[tf] else 1)
+            for tf, title in titles.items()
+        ]
+        response = spreadsheet.values_batch_get(ranges)
+        value_ranges = response.get("valueRanges", [])
+
+        requests = []
+        appended = {}
+
+        for (tf, df), value_range in zip(frames.items(), value_ranges):
+            key = (spreadsheet.id, titles[tf])
+            values = [row[0] if row else "" for row in value_range.get("values", [])]
+
+            if cached[tf] is None:
+                if values and values[0] != index_col:
+                    raise GoogleSheetsException(
+                        f"Column '{index_col}' not found in worksheet "
+                        f"{titles[tf]} header (run ensure_timeframe_tables first)"
+                    )
+                _TIMESTAMP_CACHE[key] = (ts_col, max(len(values), 1), _parse_sheet_timestamps(values[1:]))
+            else:
+                col, rows_read, seen = cached[tf]
+                seen = _merge_timestamps(seen, _parse_sheet_timestamps(values))
+                _TIMESTAMP_CACHE[key] = (col, rows_read + len(values), seen)
+
+            existing_timestamps = _TIMESTAMP_CACHE[key][2]
+            df = _normalize_for_sheet(df, index_col)
+            df = _drop_existing(df, index_col, existing_timestamps)
+
+            appended[tf] = len(df)
+            if df.empty:
+                logger.info(f"No new data to append for {tf} (all duplicates)")
+                continue
+
+            requests.append({
+                "appendCells": {
+                    "sheetId": worksheets[titles[tf]].id,
+                    "rows": _row_data(_to_sheet_values(df, index_col)),
+                    "fields": "userEnteredValue",
+                }
+            })
+            frames[tf] = df
+
+        if requests:
+            logger.info(
+                f"Appending {sum(appended.values())} new rows to "
+                f"{len(requests)} worksheets in one request"
+            )
+            _sheets_write(_batch_update, spreadsheet, {"requests": requests})
+
+            for tf, count in appended.items():
+                if count:
+                    _remember_appended(spreadsheet.id, titles[tf], frames[tf][index_col])
+
+        return appended
+
+    except HttpError as e:
+        if e.resp.status == 403 and "storageQuotaExceeded" in str(e):
+            raise StorageQuotaException(
+                "Storage quota exceeded while appending data"
+            )
+        raise GoogleSheetsException(
+            f"HTTP error while appending data: {e.resp.status} - {str(e)}"
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error: {type(e).__name__} - {str(e)}")
+        raise GoogleSheetsException(
+            f"Failed to append data to worksheets: {str(e)}"
+        )
+
+
+def append_all(
+    jobs: List[Tuple[gspread.Spreadsheet, Dict[str, pd.DataFrame]]],
+    index_col: str = "timestamp",
+    max_workers: int = MAX_CONCURRENT_SHEET_WRITES,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Append OHLCV DataFrames to several spreadsheets concurrently
+    Each spreadsheet is written with append_many (one read and one write
+    request); requests for different spreadsheets run in parallel threads
+    so total time is bounded by the slowest spreadsheet, not the sum
+    
+    Args:
+        jobs: List of (spreadsheet, {timeframe: DataFrame}) pairs
+        index_col: Column name to use for deduplication (default: 'timestamp')
+        max_workers: Maximum number of spreadsheets written at once
+    
+    Returns:
+        Dictionary mapping spreadsheet ID to append_many results
+    
+    Raises:
+        GoogleSheetsException: If any append operation fails
+    """
+    if not jobs:
+        return {}
+
+    if len(jobs) == 1:
+        spreadsheet, frames = jobs[0]
+        return {spreadsheet.id: append_many(spreadsheet, frames, index_col)}
+
+    workers = min(max_workers, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            spreadsheet.id: executor.submit(append_many, spreadsheet, frames, index_col)
+            for spreadsheet, frames in jobs
+        }
+        return {spreadsheet_id: future.result() for spreadsheet_id, future in futures.items()}
+
+
+def _normalize_for_sheet(df: pd.DataFrame, index_col: str) -> pd.DataFrame:
+    """
+    Validate schema and convert timestamps to UTC datetimes
+    
+    Args:
+        df: DataFrame with OHLCV data
+        index_col: Timestamp column name
+    
+    Returns:
+        DataFrame with REQUIRED_COLUMNS in order and UTC timestamps
+    """
+    missing = REQUIRED_COLUMNS_SET.difference(df.columns)
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+
+    timestamps = to_utc_timestamps(df[index_col])
+    if list(df.columns) != REQUIRED_COLUMNS:
+        df = df[REQUIRED_COLUMNS]
+    return df.assign(**{index_col: timestamps})
+
+
+def _to_sheet_values(df: pd.DataFrame, index_col: str) -> pd.DataFrame:
+    """Convert normalized timestamps to Sheets-compatible ISO strings"""
+    return df.assign(**{index_col: format_timestamps(df[index_col])})
+
+
+def _existing_timestamps(worksheet: gspread.Worksheet, index_col: str) -> np.ndarray:
+    """
+    Get timestamps already stored in a worksheet
+    Only the timestamp column is downloaded; for worksheets read earlier in
+    this process only the rows below the last read row are fetched
+    
+    Args:
+        worksheet: gspread Worksheet object
+        index_col: Timestamp column name
+    
+    Returns:
+        Sorted array of unique epoch seconds present in the worksheet
+    """
+    key = (worksheet.spreadsheet.id, worksheet.title)
+    cached = _TIMESTAMP_CACHE.get(key)
+
+    if cached is not None:
+        col, rows_read, seen = cached
+        new_rows = worksheet.get(_column_range(None, col, rows_read + 1))
+        seen = _merge_timestamps(seen, _parse_sheet_timestamps(row[0] for row in new_rows if row))
+        _TIMESTAMP_CACHE[key] = (col, rows_read + len(new_rows), seen)
+        return seen
+
+    # Header is normally REQUIRED_COLUMNS, so try that position first
+    col = REQUIRED_COLUMNS.index(index_col) + 1
+    values = worksheet.col_values(col)
+
+    if values and values[0] != index_col:
+        header = worksheet.row_values(1)
+        try:
+            col = header.index(index_col) + 1
+        except ValueError:
+            raise GoogleSheetsException(
+                f"Column '{index_col}' not found in worksheet header"
+            )
+        values = worksheet.col_values(col)
+
+    seen = _parse_sheet_timestamps(values[1:])
+    _TIMESTAMP_CACHE[key] = (col, max(len(values), 1), seen)
+    return seen
+
+
+def _remember_appended(spreadsheet_id: str, title: str, timestamps: pd.Series) -> None:
+    """Record rows appended by this process in the timestamp cache"""
+    key = (spreadsheet_id, title)
+    cached = _TIMESTAMP_CACHE.get(key)
+    if cached is None:
+        return
+    col, rows_read, seen = cached
+    seen = _merge_timestamps(seen, _timestamp_keys(timestamps))
+    _TIMESTAMP_CACHE[key] = (col, rows_read + len(timestamps), seen)
+
+
+def _timestamp_keys(timestamps: pd.Series) -> np.ndarray:
+    """Convert UTC datetimes to int64 epoch seconds"""
+    return timestamps.values.astype("datetime64[s]").view("i8")
+
+
+def _parse_sheet_timestamps(values) -> np.ndarray:
+    """
+    Parse timestamp strings read from a worksheet
+    Empty and unparseable cells are ignored
+    
+    Returns:
+        Sorted array of unique int64 epoch seconds
+    """
+    values = [v for v in values if v]
+    if not values:
+        return np.empty(0, dtype=np.int64)
+
+    parsed = pd.to_datetime(pd.Series(values), utc=True, format="ISO8601", errors="coerce")
+    return np.unique(_timestamp_keys(parsed.dropna()))
+
+
+def _merge_timestamps(existing: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Merge epoch seconds into a sorted, unique epoch second array"""
+    new = np.unique(keys)
+    if not len(new):
+        return existing
+    if not len(existing) or new[0] > existing[-1]:
+        return np.concatenate([existing, new])
+    return np.union1d(existing, new)
+
+
+def _drop_existing(df: pd.DataFrame, index_col: str, existing: np.ndarray) -> pd.DataFrame:
+    """
+    Drop rows whose timestamp is already stored in the worksheet
+    Comparison runs on int64 epoch seconds: rows newer than the newest
+    stored timestamp are kept without a lookup; only older rows (backfills
+    or overlaps) are checked against the sorted array with a binary search
+    
+    Args:
+        df: Normalized DataFrame with UTC timestamps
+        index_col: Timestamp column name
+        existing: Sorted array of stored epoch seconds
+    
+    Returns:
+        DataFrame with only the rows not yet in the worksheet
+    """
+    if not len(existing):
+        return df
+
+    ts = _timestamp_keys(df[index_col])
+    newer = ts > existing[-1]
+    if newer.all():
+        return df
+
+    positions = np.searchsorted(existing, ts).clip(max=len(existing) - 1)
+    return df[newer | (existing[positions] != ts)]
+
+
+def _column_range(title: Optional[str], col: int, first_row: int) -> str:
+    """Build an open-ended single-column A1 range, e.g. 'H1'!A5:A"""
+    start = rowcol_to_a1(first_row, col)
+    column = start.rstrip("0123456789")
+    range_name = f"{start}:{column}"
+    return absolute_range_name(title, range_name) if title else range_name
+
+
+def _sheets_write(func, *args, **kwargs):
+    """
+    Run a Sheets write request under the shared write limiter
+    Requests rejected with HTTP 429 are retried with exponential backoff
+    """
+    _WRITE_LIMITER.acquire()
+    return call_with_backoff(func, *args, should_retry=_is_rate_limited, **kwargs)
+
+
+def _batch_update(spreadsheet: gspread.Spreadsheet, body: dict) -> Any:
+    """
+    Send a spreadsheets.batchUpdate request
+    The body is encoded with orjson when it is installed, since cell
+    payloads of large uploads dominate the request's CPU time
+    
+    Returns:
+        Batch update response body
+    """
+    if orjson is None:
+        return spreadsheet.batch_update(body)
+    
+    response = spreadsheet.client.request(
+        "post",
+        SPREADSHEET_BATCH_UPDATE_URL % spreadsheet.id,
+        data=orjson.dumps(body),
+        headers={"Content-Type": "application/json"},
+    )
+    return response.json()
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an API error is a 429 (quota exceeded) response"""
+    if isinstance(error, gspread.exceptions.APIError):
+        return error.response.status_code == 429
+    if isinstance(error, HttpError):
+        return error.resp.status == 429
+    return False
+
+
+def _frame_rows(df: pd.DataFrame) -> List[list]:
+    """
+    Convert a DataFrame to rows of native Python values
+    Columns are converted one at a time and zipped, which avoids building
+    an intermediate object array for mixed-dtype frames (df.values)
+    """
+    columns = [df[col].tolist() for col in df.columns]
+    return [list(row) for row in zip(*columns)]
+
+
+def _row_data(df: pd.DataFrame) -> List[dict]:
+    """Build RowData payloads (typed cells) for appendCells requests"""
+    return [{"values": [_to_cell(value) for value in row]} for row in _frame_rows(df)]
+
+
+def _to_cell(value) -> dict:
+    """Build a CellData payload for an appendCells request"""
+    if isinstance(value, str):
+        return {"userEnteredValue": {"stringValue": value}}
+    return {"userEnteredValue": {"numberValue": value}}
+
+
 def _append_in_batches(
     worksheet: gspread.Worksheet,
     df: pd.DataFrame,
-    batch_size: int = 100,
+    batch_size: Optional[int] = None,
 ) -> int:
     """
-    Helper function to append DataFrame rows in batches
-    Adds small delay between batches to respect API rate limits
+    Helper function to append DataFrame rows
+    Sends all rows in one request, or one request per batch_size rows
     
     Args:
         worksheet: gspread Worksheet object
         df: DataFrame to append
-        batch_size: Number of rows per batch
+        batch_size: Optional number of rows per request (default: all rows)
     
     Returns:
         Total number of rows appended
@@ -353,32 +774,57 @@ def _append_in_batches(
     total_rows = len(df)
     rows_appended = 0
     
+    if not batch_size:
+        batch_size = total_rows
+    
     # Convert DataFrame to list of lists once
-    all_rows = df.values.tolist()
+    all_rows = _frame_rows(df)
     
     # Process in batches
     for i in range(0, total_rows, batch_size):
         batch_end = min(i + batch_size, total_rows)
         batch_rows = all_rows[i:batch_end]
         
-        logger.info(f"Appending batch: rows {i+1} to {batch_end} of {total_rows}")
+        logger.info(f"Appending rows {i+1} to {batch_end} of {total_rows}")
         
         try:
-            worksheet.append_rows(batch_rows)
+            _sheets_write(worksheet.append_rows, batch_rows, value_input_option="RAW")
             rows_appended += len(batch_rows)
-            
-            # Small delay to avoid rate limits (only if more batches remain)
-            if batch_end < total_rows:
-                time.sleep(0.5)  # 500ms delay between batches
-                
         except HttpError as e:
-            logger.error(f"Failed to append batch {i}-{batch_end}: {str(e)}")
+            logger.error(f"Failed to append rows {i}-{batch_end}: {str(e)}")
             raise
     
-    logger.info(f"Successfully appended {rows_appended} rows in {(total_rows // batch_size) + 1} batches")
+    logger.info(f"Successfully appended {rows_appended} rows")
     return rows_appended
 
 
+def _populate_empty(worksheet: gspread.Worksheet, df: pd.DataFrame) -> int:
+    """
+    Fill an empty worksheet with a single batchUpdate request
+    appendCells writes the rows after the last row with data and grows the
+    grid as needed, so a full backfill is one call and can never overwrite
+    rows already in the worksheet (such as rows without a timestamp)
+    
+    Args:
+        worksheet: gspread Worksheet object (no timestamps below the header)
+        df: DataFrame with Sheets-compatible values
+    
+    Returns:
+        Number of rows written
+    """
+    _sheets_write(_batch_update, worksheet.spreadsheet, {
+        "requests": [{
+            "appendCells": {
+                "sheetId": worksheet.id,
+                "rows": _row_data(df),
+                "fields": "userEnteredValue",
+            }
+        }]
+    })
+    logger.info(f"Successfully wrote {len(df)} rows")
+    return len(df)
+
+
 def get_spreadsheet_url(spreadsheet: gspread.Spreadsheet) -> str:
     """
     Get the URL for a spreadsheet
@@ -1,4 +1,5 @@
 """Exchanges package"""
 from .coinbase import fetch_ohlcv, validate_symbol, GRANULARITY_MAP
+from .session import get_session
 
-__all__ = ['fetch_ohlcv', 'validate_symbol', 'GRANULARITY_MAP']
\ No newline at end of file
+__all__ = ['fetch_ohlcv', 'validate_symbol', 'GRANULARITY_MAP', 'get_session']
\ No newline at end of file
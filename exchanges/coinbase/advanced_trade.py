@@ -6,23 +6,53 @@ Supports pagination for fetching all historical data
 """
 import requests
 import time
+import numpy as np
 import jwt
 import json
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple, Union
 from pathlib import Path
 from cryptography.hazmat.primitives import serialization
 
-from config.config import COINBASE_ADVANCED_TRADE_URL, API_TIMEOUT
+from config.config import (
+    COINBASE_ADVANCED_TRADE_URL,
+    API_TIMEOUT,
+    COINBASE_ADVANCED_REQUESTS_PER_SECOND,
+    COINBASE_MAX_CONCURRENT_SYMBOLS,
+)
+from exchanges.coinbase.candles import (
+    candles_to_records,
+    load_cached_chunk,
+    merge_candles,
+    parse_candles,
+    save_cached_chunk,
+)
+from exchanges.coinbase.session import fetch_chunks, get_session, parse_json, warm_up
 from utils.logger import setup_logger
 from utils.exceptions import APIException
+from utils.rate_limit import TokenBucket
 
 logger = setup_logger(__name__)
 
+# Shared by all Advanced Trade API requests of this process
+_RATE_LIMITER = TokenBucket(
+    rate=COINBASE_ADVANCED_REQUESTS_PER_SECOND,
+    capacity=COINBASE_ADVANCED_REQUESTS_PER_SECOND,
+)
+
 # Coinbase API limit per request
 MAX_CANDLES_PER_REQUEST = 300
 
+# Keys of timestamp, open, high, low, close and volume in an API candle
+ADVANCED_CANDLE_FIELDS = ("start", "open", "high", "low", "close", "volume")
+
+# Duration of one 30m candle in seconds
+CANDLE_SECONDS_30M = 30 * 60
+
 # Time range covered by 300 candles for 30m timeframe
 # 300 candles * 30 minutes = 9000 minutes = 150 hours = 6.25 days
 TIMEFRAME_COVERAGE_30M = timedelta(minutes=30 * 300)
@@ -31,13 +61,28 @@ TIMEFRAME_COVERAGE_30M = timedelta(minutes=30 * 300)
 CREDENTIALS_DIR = Path(__file__).resolve().parent.parent.parent / "credentials"
 KEY_FILE = CREDENTIALS_DIR / "cdp_api_key.json"
 
+# JWT lifetime, when a cached token is re-signed in the background,
+# and how long a signed token is reused before re-signing inline
+JWT_LIFETIME_SECONDS = 120
+JWT_REFRESH_SECONDS = 80
+JWT_REUSE_SECONDS = 100
+
+# (api_key_name, uri) -> (token, issued at as Unix time)
+_JWT_CACHE: Dict[Tuple[str, str], Tuple[str, int]] = {}
+_JWT_REFRESHING: Set[Tuple[str, str]] = set()
+_JWT_LOCK = threading.Lock()
+
+# Signs replacement tokens off the request path
+_JWT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jwt-refresh")
+
 
 def load_api_credentials() -> tuple:
     """
     Load API credentials from cdp_api_key.json
+    The PEM private key is parsed once here so JWT signing can reuse it
     
     Returns:
-        Tuple of (api_key_name, private_key)
+        Tuple of (api_key_name, private_key) with the parsed private key
     
     Raises:
         ValueError: If credentials file not found or invalid
@@ -57,8 +102,13 @@ def load_api_credentials() -> tuple:
         if not api_key_name or not private_key:
             raise ValueError("Missing 'name' or 'privateKey' in cdp_api_key.json")
         
+        private_key_obj = serialization.load_pem_private_key(
+            private_key.encode('utf-8'),
+            password=None
+        )
+        
         logger.info(f"Loaded API credentials from {KEY_FILE.name}")
-        return api_key_name, private_key
+        return api_key_name, private_key_obj
         
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {KEY_FILE}: {str(e)}")
@@ -66,13 +116,16 @@ def load_api_credentials() -> tuple:
         raise ValueError(f"Failed to load API credentials: {str(e)}")
 
 
-def build_jwt(api_key_name: str, private_key: str, uri: str) -> str:
+def build_jwt(api_key_name: str, private_key: Union[str, object], uri: str) -> str:
     """
     Build JWT token with proper headers (kid and nonce) using cryptography library
+    A signed token depends only on the key and URI, so it is cached and
+    reused by every request to that URI until shortly before it expires;
+    a replacement is signed in the background before the cached one runs out
     
     Args:
         api_key_name: API key name from cdp_api_key.json
-        private_key: Private key PEM string from cdp_api_key.json
+        private_key: Parsed private key, or private key PEM string
         uri: Request URI in format "METHOD host/path" (no query params)
     
     Returns:
@@ -81,20 +134,77 @@ def build_jwt(api_key_name: str, private_key: str, uri: str) -> str:
     Raises:
         Exception: If JWT creation fails
     """
+    cache_key = (api_key_name, uri)
+    now = time.time()
+    
+    with _JWT_LOCK:
+        cached = _JWT_CACHE.get(cache_key)
+        if cached is not None and now < cached[1] + JWT_REUSE_SECONDS:
+            if now >= cached[1] + JWT_REFRESH_SECONDS and cache_key not in _JWT_REFRESHING:
+                _JWT_REFRESHING.add(cache_key)
+                _JWT_EXECUTOR.submit(_refresh_jwt, api_key_name, private_key, uri)
+            return cached[0]
+    
+    return _sign_jwt(api_key_name, private_key, uri, now)
+
+
+def _refresh_jwt(api_key_name: str, private_key: Union[str, object], uri: str) -> None:
+    """
+    Re-sign a cached JWT in the background (runs on the JWT executor)
+    
+    Args:
+        api_key_name: API key name from cdp_api_key.json
+        private_key: Parsed private key, or private key PEM string
+        uri: Request URI in format "METHOD host/path" (no query params)
+    """
+    try:
+        _sign_jwt(api_key_name, private_key, uri, time.time())
+    except ValueError:
+        # Already logged; the next request re-signs inline once the token expires
+        pass
+    finally:
+        with _JWT_LOCK:
+            _JWT_REFRESHING.discard((api_key_name, uri))
+
+
+def _sign_jwt(
+    api_key_name: str,
+    private_key: Union[str, object],
+    uri: str,
+    now: float,
+) -> str:
+    """
+    Sign a new JWT token and store it in the cache
+    
+    Args:
+        api_key_name: API key name from cdp_api_key.json
+        private_key: Parsed private key, or private key PEM string
+        uri: Request URI in format "METHOD host/path" (no query params)
+        now: Current Unix time
+    
+    Returns:
+        JWT token string
+    
+    Raises:
+        ValueError: If JWT creation fails
+    """
     try:
         # Load private key properly using cryptography library
-        private_key_bytes = private_key.encode('utf-8')
-        private_key_obj = serialization.load_pem_private_key(
-            private_key_bytes, 
-            password=None
-        )
+        if isinstance(private_key, str):
+            private_key_obj = serialization.load_pem_private_key(
+                private_key.encode('utf-8'),
+                password=None
+            )
+        else:
+            private_key_obj = private_key
         
-        # Build JWT payload
+        # Build JWT payload (one clock read keeps nbf and exp consistent)
+        issued_at = int(now)
         jwt_payload = {
             'sub': api_key_name,
             'iss': 'coinbase-cloud',
-            'nbf': int(time.time()),
-            'exp': int(time.time()) + 120,  # Token valid for 2 minutes
+            'nbf': issued_at,
+            'exp': issued_at + JWT_LIFETIME_SECONDS,  # Token valid for 2 minutes
             'uri': uri,
         }
         
@@ -105,10 +215,13 @@ def build_jwt(api_key_name: str, private_key: str, uri: str) -> str:
             algorithm='ES256',
             headers={
                 'kid': api_key_name,
-                'nonce': secrets.token_hex()
+                'nonce': secrets.token_hex(32)
             }
         )
         
+        with _JWT_LOCK:
+            _JWT_CACHE[(api_key_name, uri)] = (token, issued_at)
+        
         return token
         
     except Exception as e:
@@ -128,31 +241,20 @@ def calculate_pagination_params(start_year: int, end_year: int) -> List[tuple]:
         List of (start_timestamp, end_timestamp) tuples as Unix timestamps
     """
     # End date: Dec 31 of the end_year at 23:59:59
-    end_date = datetime(end_year, 12, 31, 23, 59, 59)
+    end_ts = int(datetime(end_year, 12, 31, 23, 59, 59).timestamp())
     
     # Start date: Jan 1 of start_year at 00:00:00
-    start_date = datetime(start_year, 1, 1, 0, 0, 0)
-    
-    # Generate pagination chunks
-    chunks = []
-    current_end = end_date
+    start_ts = int(datetime(start_year, 1, 1, 0, 0, 0).timestamp())
     
-    while current_end > start_date:
-        current_start = current_end - TIMEFRAME_COVERAGE_30M
-        
-        # Don't go before our absolute start date
-        if current_start < start_date:
-            current_start = start_date
-        
-        chunks.append((
-            int(current_start.timestamp()),
-            int(current_end.timestamp())
-        ))
-        
-        current_end = current_start
+    # Generate all chunk boundaries at once; inner boundaries sit on a fixed
+    # grid so overlapping ranges produce identical (cacheable) chunks
+    step = int(TIMEFRAME_COVERAGE_30M.total_seconds())
+    first_edge = (start_ts // step + 1) * step
+    inner_edges = np.arange(first_edge, end_ts, step, dtype=np.int64)
     
-    # Reverse to fetch oldest to newest
-    chunks.reverse()
+    # Bounded by our absolute start and end dates, ordered oldest to newest
+    edges = [start_ts] + inner_edges.tolist() + [end_ts]
+    chunks = list(zip(edges[:-1], edges[1:]))
     
     logger.info(f"Calculated {len(chunks)} pagination chunks for 30m timeframe ({start_year} to {end_year})")
     return chunks
@@ -163,7 +265,7 @@ def fetch_ohlcv_chunk_advanced(
     start_timestamp: int,
     end_timestamp: int,
     api_key_name: str,
-    private_key: str,
+    private_key: Union[str, object],
 ) -> List[Dict]:
     """
     Fetch a single chunk of 30m OHLCV data from Advanced Trade API
@@ -173,26 +275,32 @@ def fetch_ohlcv_chunk_advanced(
         start_timestamp: Unix timestamp for start
         end_timestamp: Unix timestamp for end
         api_key_name: Coinbase API key name
-        private_key: Coinbase API private key (PEM format)
+        private_key: Coinbase API private key (parsed, or PEM string)
     
     Returns:
         List of OHLCV dictionaries
     """
-    # Use STRING enum for granularity (CRITICAL!)
-    granularity = "THIRTY_MINUTE"
-    product_id = symbol
+    candles = _fetch_candles_advanced(
+        symbol, start_timestamp, end_timestamp, api_key_name, private_key
+    )
+    return candles_to_records(candles, symbol)
+
+
+@lru_cache(maxsize=None)
+def _candles_endpoint(product_id: str) -> Tuple[str, str]:
+    """
+    Build the candles URL and JWT URI for a product (cached per product)
+    
+    Args:
+        product_id: Trading pair symbol (e.g., 'BTC-USD')
     
+    Returns:
+        Tuple of (request URL, JWT URI)
+    """
     # Build request path (without query parameters for JWT URI)
     request_path = f"/api/v3/brokerage/products/{product_id}/candles"
     request_host = "api.coinbase.com"
     
-    # Build query parameters
-    params = {
-        "granularity": granularity,
-        "start": str(start_timestamp),
-        "end": str(end_timestamp),
-    }
-    
     # Build full URL
     base_url = "https://api.coinbase.com"
     url = f"{base_url}{request_path}"
@@ -200,6 +308,38 @@ def fetch_ohlcv_chunk_advanced(
     # Build URI for JWT (METHOD + host + path, NO query params!)
     uri = f"GET {request_host}{request_path}"
     
+    return url, uri
+
+
+def _fetch_candles_advanced(
+    symbol: str,
+    start_timestamp: int,
+    end_timestamp: int,
+    api_key_name: str,
+    private_key: Union[str, object],
+) -> np.ndarray:
+    """
+    Fetch a single chunk of 30m OHLCV data as a candle array
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        start_timestamp: Unix timestamp for start
+        end_timestamp: Unix timestamp for end
+        api_key_name: Coinbase API key name
+        private_key: Coinbase API private key (parsed, or PEM string)
+    
+    Returns:
+        Candle array (see exchanges.coinbase.candles.CANDLE_DTYPE)
+    """
+    url, uri = _candles_endpoint(symbol)
+    
+    # Build query parameters (STRING enum for granularity is CRITICAL!)
+    params = {
+        "granularity": "THIRTY_MINUTE",
+        "start": str(start_timestamp),
+        "end": str(end_timestamp),
+    }
+    
     try:
         # Create JWT token for authentication
         jwt_token = build_jwt(
@@ -215,7 +355,7 @@ def fetch_ohlcv_chunk_advanced(
         }
         
         # Make request
-        response = requests.get(
+        response = get_session().get(
             url,
             params=params,
             headers=headers,
@@ -224,8 +364,7 @@ def fetch_ohlcv_chunk_advanced(
         response.raise_for_status()
         
     except requests.exceptions.HTTPError as e:
-        error_msg = f"HTTP error {e.response.status_code}: {e.response.text}"
-        
+        # The response body is only decoded for messages that include it
         if e.response.status_code == 401:
             error_msg = (
                 "Authentication failed. Please check:\n"
@@ -238,6 +377,8 @@ def fetch_ohlcv_chunk_advanced(
             error_msg = "Access forbidden. Check API key permissions."
         elif e.response.status_code == 400:
             error_msg = f"Bad request: {e.response.text}\nMake sure granularity is 'THIRTY_MINUTE' (string, not integer)"
+        else:
+            error_msg = f"HTTP error {e.response.status_code}: {e.response.text}"
         
         raise APIException(error_msg)
         
@@ -249,7 +390,7 @@ def fetch_ohlcv_chunk_advanced(
     
     # Parse response
     try:
-        data = response.json()
+        data = parse_json(response)
     except ValueError as e:
         raise APIException(f"Invalid JSON response: {str(e)}")
     
@@ -259,27 +400,16 @@ def fetch_ohlcv_chunk_advanced(
     candles = data.get("candles", [])
     
     # Standardize the candle data
-    standardized = []
-    for candle in candles:
-        try:
-            # Advanced Trade API returns timestamps as Unix timestamps in string format
-            timestamp_unix = int(candle["start"])
-            
-            standardized.append({
-                "timestamp": datetime.utcfromtimestamp(timestamp_unix).isoformat(),
-                "open": float(candle["open"]),
-                "high": float(candle["high"]),
-                "low": float(candle["low"]),
-                "close": float(candle["close"]),
-                "volume": float(candle["volume"]),
-                "symbol": symbol.replace("-", "/"),
-            })
-            
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Skipping malformed candle: {candle} - Error: {e}")
-            continue
-    
-    return standardized
+    # Advanced Trade API returns timestamps and prices as strings
+    return parse_candles(candles, ADVANCED_CANDLE_FIELDS)
+
+
+def _describe_chunk(chunk: tuple) -> str:
+    """Format a (start, end) Unix timestamp chunk for log messages"""
+    start_ts, end_ts = chunk
+    start_str = datetime.utcfromtimestamp(start_ts).strftime("%Y-%m-%d %H:%M")
+    end_str = datetime.utcfromtimestamp(end_ts).strftime("%Y-%m-%d %H:%M")
+    return f"{start_str} to {end_str}"
 
 
 def fetch_ohlcv_advanced(
@@ -311,6 +441,9 @@ def fetch_ohlcv_advanced(
             f"Advanced Trade API handler only supports '30m' timeframe, got '{timeframe}'"
         )
     
+    # Open the TLS connection while the key is loaded and the first JWT signed
+    warm_up(f"{COINBASE_ADVANCED_TRADE_URL}/time")
+    
     # Load API credentials from cdp_api_key.json
     try:
         api_key_name, private_key = load_api_credentials()
@@ -318,6 +451,130 @@ def fetch_ohlcv_advanced(
     except ValueError as e:
         raise APIException(str(e))
     
+    return _fetch_ohlcv_advanced(symbol, start_year, end_year, api_key_name, private_key)
+
+
+def fetch_ohlcv_advanced_many(
+    symbols: List[str],
+    timeframe: str,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    max_workers: int = COINBASE_MAX_CONCURRENT_SYMBOLS,
+) -> Dict[str, List[Dict]]:
+    """
+    Fetch 30m OHLCV data for several symbols concurrently
+    Credentials are loaded once and all symbols share the HTTP session,
+    the cached JWTs and the Advanced Trade rate limiter
+    
+    Args:
+        symbols: Trading pair symbols (e.g., ['BTC-USD', 'ETH-USD'])
+        timeframe: Candle timeframe (must be '30m')
+        start_year: Optional year to start fetching data from (e.g., 2022)
+        end_year: Optional year to fetch data up to (e.g., 2024)
+        max_workers: Maximum number of symbols fetched at the same time
+    
+    Returns:
+        Dictionary mapping each symbol to its OHLCV dictionaries
+        (symbols whose fetch failed are left out)
+    
+    Raises:
+        APIException: If credentials cannot be loaded
+        ValueError: If timeframe is not 30m
+    """
+    if timeframe != "30m":
+        raise ValueError(
+            f"Advanced Trade API handler only supports '30m' timeframe, got '{timeframe}'"
+        )
+    
+    if not symbols:
+        return {}
+    
+    warm_up(f"{COINBASE_ADVANCED_TRADE_URL}/time")
+    
+    try:
+        api_key_name, private_key = load_api_credentials()
+        logger.info("API credentials loaded successfully from cdp_api_key.json")
+    except ValueError as e:
+        raise APIException(str(e))
+    
+    results = {}
+    workers = max(1, min(max_workers, len(symbols)))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            symbol: executor.submit(
+                _fetch_ohlcv_advanced, symbol, start_year, end_year, api_key_name, private_key
+            )
+            for symbol in symbols
+        }
+        
+        for symbol, future in futures.items():
+            try:
+                results[symbol] = future.result()
+            except (APIException, ValueError) as e:
+                logger.error(f"Failed to fetch {symbol} 30m: {str(e)}")
+    
+    return results
+
+
+def _fetch_chunk_cached(
+    symbol: str,
+    start_ts: int,
+    end_ts: int,
+    api_key_name: str,
+    private_key: Union[str, object],
+) -> np.ndarray:
+    """
+    Fetch a 30m chunk and cache it once all of its candles have closed
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        start_ts: Unix timestamp for start
+        end_ts: Unix timestamp for end
+        api_key_name: Coinbase API key name
+        private_key: Coinbase API private key (parsed, or PEM string)
+    
+    Returns:
+        Candle array
+    """
+    candles = _fetch_candles_advanced(
+        symbol=symbol,
+        start_timestamp=start_ts,
+        end_timestamp=end_ts,
+        api_key_name=api_key_name,
+        private_key=private_key,
+    )
+    
+    if end_ts + CANDLE_SECONDS_30M <= time.time():
+        save_cached_chunk(symbol, "30m", start_ts, end_ts, candles)
+    
+    return candles
+
+
+def _fetch_ohlcv_advanced(
+    symbol: str,
+    start_year: Optional[int],
+    end_year: Optional[int],
+    api_key_name: str,
+    private_key: Union[str, object],
+) -> List[Dict]:
+    """
+    Fetch 30m OHLCV data for one symbol with already loaded credentials
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        start_year: Optional year to start fetching data from
+        end_year: Optional year to fetch data up to
+        api_key_name: Coinbase API key name
+        private_key: Coinbase API private key (parsed, or PEM string)
+    
+    Returns:
+        List of standardized OHLCV dictionaries
+    
+    Raises:
+        APIException: If API request fails
+        ValueError: If start_year is after end_year
+    """
     # If no years specified, fetch latest 300 candles
     if not start_year and not end_year:
         logger.info(f"Fetching latest {MAX_CANDLES_PER_REQUEST} candles for {symbol} 30m")
@@ -326,13 +583,14 @@ def fetch_ohlcv_advanced(
         end_timestamp = int(time.time())
         start_timestamp = end_timestamp - int(TIMEFRAME_COVERAGE_30M.total_seconds())
         
-        return fetch_ohlcv_chunk_advanced(
+        candles = _fetch_candles_advanced(
             symbol=symbol,
             start_timestamp=start_timestamp,
             end_timestamp=end_timestamp,
             api_key_name=api_key_name,
             private_key=private_key
         )
+        return candles_to_records(merge_candles([candles]), symbol)
     
     # Validate year inputs
     if start_year and end_year:
@@ -351,59 +609,40 @@ def fetch_ohlcv_advanced(
     logger.info(f"Fetching historical 30m data for {symbol} from {start_year} to {end_year}")
     chunks = calculate_pagination_params(start_year, end_year)
     
-    all_data = []
-    total_chunks = len(chunks)
-    
-    for idx, (start_ts, end_ts) in enumerate(chunks, 1):
-        start_str = datetime.utcfromtimestamp(start_ts).strftime("%Y-%m-%d %H:%M")
-        end_str = datetime.utcfromtimestamp(end_ts).strftime("%Y-%m-%d %H:%M")
-        
-        logger.info(f"Fetching chunk {idx}/{total_chunks}: {start_str} to {end_str}")
-        
-        try:
-            chunk_data = fetch_ohlcv_chunk_advanced(
-                symbol=symbol,
-                start_timestamp=start_ts,
-                end_timestamp=end_ts,
-                api_key_name=api_key_name,
-                private_key=private_key
-            )
-            
-            if chunk_data:
-                all_data.extend(chunk_data)
-                logger.info(f"  → Received {len(chunk_data)} candles")
-            else:
-                logger.warning(f"  → No data in this chunk")
-            
-            # Sleep between requests to avoid rate limiting
-            # Advanced Trade API has stricter limits, use 0.3s to be safe
-            if idx < total_chunks:
-                time.sleep(0.3)
-                
-        except APIException as e:
-            logger.error(f"Error fetching chunk {idx}/{total_chunks}: {str(e)}")
-            # Continue with next chunk instead of failing completely
-            continue
-    
-    # Remove duplicates based on timestamp
-    if all_data:
-        seen = set()
-        unique_data = []
-        for candle in all_data:
-            ts = candle["timestamp"]
-            if ts not in seen:
-                seen.add(ts)
-                unique_data.append(candle)
-        
-        # Sort chronologically
-        unique_data.sort(key=lambda x: x["timestamp"])
+    # Reuse chunks cached by earlier backfills
+    chunk_candles = []
+    pending_chunks = []
+    for start_ts, end_ts in chunks:
+        cached = load_cached_chunk(symbol, "30m", start_ts, end_ts)
+        if cached is None:
+            pending_chunks.append((start_ts, end_ts))
+        elif len(cached):
+            chunk_candles.append(cached)
+    
+    if len(pending_chunks) < len(chunks):
+        logger.info(f"Loaded {len(chunks) - len(pending_chunks)}/{len(chunks)} chunks from cache")
+    
+    # Fetch remaining chunks concurrently, paced by the shared rate limiter
+    chunk_candles += fetch_chunks(
+        lambda start_ts, end_ts: _fetch_chunk_cached(
+            symbol, start_ts, end_ts, api_key_name, private_key
+        ),
+        pending_chunks,
+        _RATE_LIMITER,
+        describe=_describe_chunk,
+    )
+    
+    # Remove duplicates based on timestamp and sort chronologically
+    if chunk_candles:
+        total_received = sum(len(chunk) for chunk in chunk_candles)
+        candles = merge_candles(chunk_candles)
         
-        duplicates_removed = len(all_data) - len(unique_data)
+        duplicates_removed = total_received - len(candles)
         if duplicates_removed > 0:
             logger.info(f"Removed {duplicates_removed} duplicate candles")
         
-        logger.info(f"Successfully fetched {len(unique_data)} total candles")
-        return unique_data
+        logger.info(f"Successfully fetched {len(candles)} total candles")
+        return candles_to_records(candles, symbol)
     
     logger.warning("No data fetched")
     return []
\ No newline at end of file
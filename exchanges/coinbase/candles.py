@@ -0,0 +1,264 @@
+"""
+Columnar candle storage for Coinbase API clients
+Chunks are parsed into NumPy structured arrays, merged and deduplicated
+with vectorized operations, and converted to OHLCV dictionaries only once.
+Completed chunks can be cached on disk so repeated backfills skip them
+"""
+import os
+import numpy as np
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from config.config import CANDLE_CACHE_DIR
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# One candle: Unix timestamp (seconds) and OHLCV values
+CANDLE_DTYPE = np.dtype([
+    ("timestamp", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+
+def empty_candles() -> np.ndarray:
+    """Create an empty candle array"""
+    return np.empty(0, dtype=CANDLE_DTYPE)
+
+
+def parse_candles(raw_candles: List[Any], fields: Sequence) -> np.ndarray:
+    """
+    Parse raw API candles into a candle array with one bulk conversion
+    Values may be numbers or numeric strings; if any candle is malformed,
+    candles are parsed one by one and the malformed ones are skipped
+
+    Args:
+        raw_candles: Candles as decoded from the JSON response (lists or dicts)
+        fields: Index or key of timestamp, open, high, low, close and volume
+                within each raw candle
+
+    Returns:
+        Candle array in response order
+    """
+    if not raw_candles:
+        return empty_candles()
+
+    try:
+        values = np.array(list(map(itemgetter(*fields), raw_candles)), dtype=np.float64)
+    except (IndexError, KeyError, TypeError, ValueError):
+        values = None
+
+    if values is None or values.ndim != 2 or not np.isfinite(values[:, 0]).all():
+        return _parse_candles_rowwise(raw_candles, fields)
+
+    candles = np.empty(len(values), dtype=CANDLE_DTYPE)
+    for position, name in enumerate(CANDLE_DTYPE.names):
+        candles[name] = values[:, position]
+    return candles
+
+
+def _parse_candles_rowwise(raw_candles: List[Any], fields: Sequence) -> np.ndarray:
+    """
+    Parse raw API candles one by one, skipping malformed candles
+
+    Args:
+        raw_candles: Candles as decoded from the JSON response (lists or dicts)
+        fields: Index or key of timestamp, open, high, low, close and volume
+
+    Returns:
+        Candle array in response order
+    """
+    ts_field, *value_fields = fields
+    rows = []
+    for candle in raw_candles:
+        try:
+            rows.append((int(candle[ts_field]), *(float(candle[f]) for f in value_fields)))
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping malformed candle: {candle} - Error: {e}")
+            continue
+
+    return np.array(rows, dtype=CANDLE_DTYPE)
+
+
+def merge_candles(chunks: List[np.ndarray]) -> np.ndarray:
+    """
+    Merge candle chunks into one chronologically sorted array
+    When a timestamp appears in several chunks the first occurrence is kept
+
+    Chunks arrive in chronological order, so overlap is trimmed at each chunk
+    boundary while accumulating; a full sort is only needed when chunks overlap
+    out of order
+
+    Args:
+        chunks: List of candle arrays
+
+    Returns:
+        Sorted candle array with unique timestamps
+    """
+    merged = []
+    last_ts = None
+
+    for position, chunk in enumerate(chunks):
+        if not len(chunk):
+            continue
+
+        chunk = _sorted_unique(chunk)
+        timestamps = chunk["timestamp"]
+
+        if last_ts is not None:
+            if timestamps[-1] > last_ts and timestamps[0] <= last_ts:
+                # Drop the candles already covered by the previous chunks
+                chunk = chunk[np.searchsorted(timestamps, last_ts, side="right"):]
+            elif timestamps[-1] <= last_ts:
+                # Chunk lies behind the accumulated range: fall back to a full merge
+                rest = [c for c in chunks[position + 1:] if len(c)]
+                return _sorted_unique(np.concatenate(merged + [chunk] + rest))
+
+        merged.append(chunk)
+        last_ts = chunk["timestamp"][-1]
+
+    if not merged:
+        return empty_candles()
+
+    return merged[0] if len(merged) == 1 else np.concatenate(merged)
+
+
+def _sorted_unique(candles: np.ndarray) -> np.ndarray:
+    """
+    Sort a candle array by timestamp, keeping the first of any duplicates
+    Arrays that are already strictly ascending (or descending, as returned by
+    the Coinbase APIs) are handled without sorting
+
+    Args:
+        candles: Candle array
+
+    Returns:
+        Sorted candle array with unique timestamps
+    """
+    timestamps = candles["timestamp"]
+    steps = np.diff(timestamps)
+
+    if (steps > 0).all():
+        return candles
+    if (steps < 0).all():
+        return candles[::-1]
+
+    _, first_index = np.unique(timestamps, return_index=True)
+    return candles[first_index]
+
+
+def get_chunk_cache_path(symbol: str, granularity: str, start_ts: int, end_ts: int) -> Path:
+    """
+    Get the cache file path of a pagination chunk
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        granularity: Candle granularity label (e.g., '30m')
+        start_ts: Chunk start as Unix timestamp
+        end_ts: Chunk end as Unix timestamp
+
+    Returns:
+        Path to the chunk's .npy file
+    """
+    return CANDLE_CACHE_DIR / symbol / f"{granularity}_{start_ts}_{end_ts}.npy"
+
+
+def load_cached_chunk(
+    symbol: str, granularity: str, start_ts: int, end_ts: int
+) -> Optional[np.ndarray]:
+    """
+    Load a cached pagination chunk
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        granularity: Candle granularity label (e.g., '30m')
+        start_ts: Chunk start as Unix timestamp
+        end_ts: Chunk end as Unix timestamp
+
+    Returns:
+        Candle array, or None if the chunk is not cached (or unreadable)
+    """
+    path = get_chunk_cache_path(symbol, granularity, start_ts, end_ts)
+    if not path.exists():
+        return None
+
+    try:
+        candles = np.load(path, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable chunk cache {path.name}: {str(e)}")
+        return None
+
+    if candles.dtype != CANDLE_DTYPE:
+        logger.warning(f"Ignoring chunk cache {path.name} with unexpected layout")
+        return None
+
+    return candles
+
+
+def save_cached_chunk(
+    symbol: str, granularity: str, start_ts: int, end_ts: int, candles: np.ndarray
+) -> None:
+    """
+    Cache a completed pagination chunk (written atomically)
+    Only chunks whose candles have all closed should be cached
+
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        granularity: Candle granularity label (e.g., '30m')
+        start_ts: Chunk start as Unix timestamp
+        end_ts: Chunk end as Unix timestamp
+        candles: Candle array fetched for the chunk
+    """
+    path = get_chunk_cache_path(symbol, granularity, start_ts, end_ts)
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, candles, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # The cache is an optimization only; the fetched data is still returned
+        logger.warning(f"Failed to cache chunk {path.name}: {str(e)}")
+
+
+def candles_to_records(candles: np.ndarray, symbol: str) -> List[Dict]:
+    """
+    Convert a candle array to standardized OHLCV dictionaries
+
+    Args:
+        candles: Candle array
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+
+    Returns:
+        List of OHLCV dictionaries with ISO timestamps and 'BTC/USD' symbols
+    """
+    symbol_out = symbol.replace("-", "/")
+    # Format every timestamp in one vectorized pass (same output as isoformat())
+    iso_timestamps = np.datetime_as_string(
+        candles["timestamp"].astype("datetime64[s]"), unit="s"
+    ).tolist()
+    return [
+        {
+            "timestamp": iso_ts,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "symbol": symbol_out,
+        }
+        for iso_ts, open_, high, low, close, volume in zip(
+            iso_timestamps,
+            candles["open"].tolist(),
+            candles["high"].tolist(),
+            candles["low"].tolist(),
+            candles["close"].tolist(),
+            candles["volume"].tolist(),
+        )
+    ]
@@ -4,23 +4,39 @@ Handles fetching OHLCV data from Coinbase Exchange API (REST)
 Supports: 5m, 1h, 6h, 1d timeframes with pagination based on number of candles
 """
 import requests
-import time
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from config.config import (
     COINBASE_BASE_URL,
     GRANULARITY_MAP,
     API_TIMEOUT,
     EXCHANGE_API_TIMEFRAMES,
+    COINBASE_EXCHANGE_REQUESTS_PER_SECOND,
 )
+from exchanges.coinbase.candles import candles_to_records, merge_candles, parse_candles
+from exchanges.coinbase.session import fetch_chunks, get_session, parse_json
 from utils.logger import setup_logger
 from utils.exceptions import APIException
+from utils.rate_limit import TokenBucket
 
 logger = setup_logger(__name__)
 
+# Shared by all Exchange API requests of this process
+_RATE_LIMITER = TokenBucket(
+    rate=COINBASE_EXCHANGE_REQUESTS_PER_SECOND,
+    capacity=COINBASE_EXCHANGE_REQUESTS_PER_SECOND,
+)
+
+# Symbols confirmed to exist by validate_symbol
+_VALID_SYMBOLS: Set[str] = set()
+
 # Coinbase API limit per request
 MAX_CANDLES_PER_REQUEST = 300
 
+# Positions of timestamp, open, high, low, close and volume in an API candle
+EXCHANGE_CANDLE_FIELDS = (0, 3, 2, 1, 4, 5)
+
 # Granularity in seconds for each timeframe
 TIMEFRAME_SECONDS = {
     "5m": 300,      # 5 minutes
@@ -101,6 +117,22 @@ def fetch_ohlcv_chunk(
     Returns:
         List of OHLCV dictionaries
     """
+    return candles_to_records(_fetch_candles(symbol, timeframe, start, end), symbol)
+
+
+def _fetch_candles(symbol: str, timeframe: str, start: str, end: str) -> np.ndarray:
+    """
+    Fetch a single chunk of OHLCV data as a candle array
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTC-USD')
+        timeframe: Candle timeframe
+        start: ISO 8601 start date
+        end: ISO 8601 end date
+    
+    Returns:
+        Candle array (see exchanges.coinbase.candles.CANDLE_DTYPE)
+    """
     if timeframe not in GRANULARITY_MAP:
         raise ValueError(f"Unsupported timeframe: {timeframe}")
 
@@ -113,9 +145,7 @@ def fetch_ohlcv_chunk(
     url = f"{COINBASE_BASE_URL}/products/{symbol}/candles"
 
     try:
-        response = requests.get(url, params=params, timeout=API_TIMEOUT)
-        print(f"[DEBUG 5m] URL: {response.url}")
-        print(f"[DEBUG 5m] Status: {response.status_code} | Body preview: {response.text[:300]}")
+        response = get_session().get(url, params=params, timeout=API_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.Timeout:
         raise APIException(f"Request timeout after {API_TIMEOUT}s")
@@ -125,7 +155,7 @@ def fetch_ohlcv_chunk(
         raise APIException(f"Request failed: {str(e)}")
 
     try:
-        candles = response.json()
+        candles = parse_json(response)
     except ValueError as e:
         raise APIException(f"Invalid JSON response: {str(e)}")
 
@@ -135,24 +165,8 @@ def fetch_ohlcv_chunk(
     # Coinbase returns newest → oldest, so reverse
     candles.reverse()
 
-    standardized = []
-    for candle in candles:
-        try:
-            # Coinbase format: [time, low, high, open, close, volume]
-            standardized.append({
-                "timestamp": datetime.utcfromtimestamp(candle[0]).isoformat(),
-                "open": candle[3],
-                "high": candle[2],
-                "low": candle[1],
-                "close": candle[4],
-                "volume": candle[5],
-                "symbol": symbol.replace("-", "/"),
-            })
-        except (IndexError, KeyError, TypeError) as e:
-            logger.warning(f"Skipping malformed candle: {candle} - Error: {e}")
-            continue
-
-    return standardized
+    # Coinbase format: [time, low, high, open, close, volume]
+    return parse_candles(candles, EXCHANGE_CANDLE_FIELDS)
 
 
 def fetch_ohlcv(
@@ -214,55 +228,29 @@ def fetch_ohlcv(
     logger.info(f"Fetching {num_candles} candles for {symbol} {timeframe}")
     chunks = calculate_time_ranges(timeframe, num_candles)
     
-    all_data = []
-    total_chunks = len(chunks)
+    # Fetch chunks concurrently, paced by the shared rate limiter
+    chunk_candles = fetch_chunks(
+        lambda start, end: _fetch_candles(
+            symbol=symbol,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+        ),
+        chunks,
+        _RATE_LIMITER,
+    )
     
-    for idx, (start, end) in enumerate(chunks, 1):
-        logger.info(f"Fetching chunk {idx}/{total_chunks}: {start} to {end}")
+    # Remove duplicates based on timestamp and sort chronologically
+    if chunk_candles:
+        total_received = sum(len(chunk) for chunk in chunk_candles)
+        candles = merge_candles(chunk_candles)
         
-        try:
-            chunk_data = fetch_ohlcv_chunk(
-                symbol=symbol,
-                timeframe=timeframe,
-                start=start,
-                end=end
-            )
-            
-            if chunk_data:
-                all_data.extend(chunk_data)
-                logger.info(f"  → Received {len(chunk_data)} candles")
-            else:
-                logger.warning(f"  → No data in this chunk")
-            
-            # Sleep between requests to avoid rate limiting
-            # Coinbase allows ~10 requests per second, so 0.2s is safe
-            if idx < total_chunks:  # Don't sleep after last request
-                time.sleep(0.2)
-                
-        except APIException as e:
-            logger.error(f"Error fetching chunk {idx}/{total_chunks}: {str(e)}")
-            # Continue with next chunk instead of failing completely
-            continue
-    
-    # Remove duplicates based on timestamp
-    if all_data:
-        seen = set()
-        unique_data = []
-        for candle in all_data:
-            ts = candle["timestamp"]
-            if ts not in seen:
-                seen.add(ts)
-                unique_data.append(candle)
-        
-        # Sort chronologically
-        unique_data.sort(key=lambda x: x["timestamp"])
-        
-        duplicates_removed = len(all_data) - len(unique_data)
+        duplicates_removed = total_received - len(candles)
         if duplicates_removed > 0:
             logger.info(f"Removed {duplicates_removed} duplicate candles")
         
-        logger.info(f"Successfully fetched {len(unique_data)} total candles")
-        return unique_data
+        logger.info(f"Successfully fetched {len(candles)} total candles")
+        return candles_to_records(candles, symbol)
     
     logger.warning("No data fetched")
     return []
@@ -271,6 +259,7 @@ def fetch_ohlcv(
 def validate_symbol(symbol: str) -> bool:
     """
     Validate if a trading pair exists on Coinbase
+    Symbols found to exist are cached for the rest of the process
     
     Args:
         symbol: Trading pair symbol (e.g., 'BTC-USD')
@@ -278,10 +267,18 @@ def validate_symbol(symbol: str) -> bool:
     Returns:
         True if symbol exists, False otherwise
     """
+    if symbol in _VALID_SYMBOLS:
+        return True
+    
     url = f"{COINBASE_BASE_URL}/products/{symbol}"
     
     try:
-        response = requests.get(url, timeout=API_TIMEOUT)
-        return response.status_code == 200
+        response = get_session().get(url, timeout=API_TIMEOUT)
     except requests.exceptions.RequestException:
-        return False
\ No newline at end of file
+        return False
+    
+    # Only confirmed symbols are remembered; failures are re-checked next time
+    if response.status_code == 200:
+        _VALID_SYMBOLS.add(symbol)
+        return True
+    return False
\ No newline at end of file
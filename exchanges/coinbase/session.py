@@ -0,0 +1,156 @@
+"""
+Shared HTTP session and chunk scheduling for Coinbase API clients
+Keeps TLS connections to Coinbase hosts alive across pagination chunks
+and fetches chunks concurrently within the API rate limits
+"""
+import json
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import API_TIMEOUT, COINBASE_MAX_CONCURRENT_REQUESTS
+from utils.logger import setup_logger
+from utils.exceptions import APIException
+from utils.rate_limit import TokenBucket
+
+logger = setup_logger(__name__)
+
+# orjson decodes candle payloads much faster; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Retry transient failures (rate limiting and server errors) on idempotent GETs
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET", "HEAD"],
+    raise_on_status=False,
+)
+
+# One connection pool per Coinbase host (Exchange + Advanced Trade), sized to
+# the number of concurrent chunk requests; blocking on an exhausted pool reuses
+# the warm connections instead of opening extra ones that are thrown away
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=COINBASE_MAX_CONCURRENT_REQUESTS,
+        pool_block=True,
+        max_retries=_RETRY,
+    ),
+)
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared Coinbase HTTP session
+    Pooled and retrying; reused by every chunk request of a backfill
+
+    Returns:
+        requests Session shared by the Coinbase clients
+    """
+    return _SESSION
+
+
+def warm_up(url: str) -> threading.Thread:
+    """
+    Open a connection to a Coinbase host in the background
+    A cheap HEAD request completes the TCP + TLS handshake while the caller
+    does other setup work, so the first chunk request reuses a warm socket
+
+    Args:
+        url: Any URL on the host to warm up
+
+    Returns:
+        The started (daemon) thread
+    """
+    def run() -> None:
+        try:
+            _SESSION.head(url, timeout=API_TIMEOUT)
+        except requests.RequestException as e:
+            # Best effort only: the real request will surface any failure
+            logger.debug(f"Connection warm-up failed for {url}: {str(e)}")
+
+    thread = threading.Thread(target=run, name="coinbase-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body straight from bytes
+    
+    Args:
+        response: HTTP response
+    
+    Returns:
+        Decoded JSON value
+    
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return _json_loads(response.content)
+
+
+def fetch_chunks(
+    fetch_chunk: Callable[[Any, Any], Any],
+    chunks: List[tuple],
+    limiter: TokenBucket,
+    describe: Optional[Callable[[tuple], str]] = None,
+    max_workers: int = COINBASE_MAX_CONCURRENT_REQUESTS,
+) -> List[Any]:
+    """
+    Fetch pagination chunks concurrently and collect results in chunk order
+    Each request first takes a token from the limiter, so the request rate
+    stays within the API limit while round-trips overlap
+    
+    Args:
+        fetch_chunk: Function taking (start, end) and returning a candle array
+        chunks: List of (start, end) chunk bounds
+        limiter: Rate limiter shared by requests to the same API
+        describe: Optional function formatting a chunk for log messages
+        max_workers: Maximum number of requests in flight
+    
+    Returns:
+        Per-chunk results, in chunk order (failed chunks are skipped)
+    """
+    total_chunks = len(chunks)
+    describe = describe or (lambda chunk: f"{chunk[0]} to {chunk[1]}")
+
+    def run(idx: int, chunk: tuple) -> Any:
+        limiter.acquire()
+        logger.info(f"Fetching chunk {idx}/{total_chunks}: {describe(chunk)}")
+        return fetch_chunk(*chunk)
+
+    results = []
+    workers = max(1, min(max_workers, total_chunks))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run, idx, chunk)
+            for idx, chunk in enumerate(chunks, 1)
+        ]
+
+        for idx, future in enumerate(futures, 1):
+            try:
+                chunk_data = future.result()
+            except APIException as e:
+                logger.error(f"Error fetching chunk {idx}/{total_chunks}: {str(e)}")
+                # Continue with next chunk instead of failing completely
+                continue
+
+            if len(chunk_data):
+                results.append(chunk_data)
+                logger.info(f"  → Chunk {idx}: received {len(chunk_data)} candles")
+            else:
+                logger.warning(f"  → Chunk {idx}: no data")
+
+    return results
@@ -2,15 +2,36 @@
 Weekly Data Aggregator
 Aggregates daily (1d) OHLCV data into weekly (1w) timeframe
 """
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from types import MappingProxyType
+from typing import Any, List, Dict, Optional, Tuple, Union
+from config.config import REQUIRED_COLUMNS, REQUIRED_COLUMNS_SET
 from utils.logger import setup_logger
 from utils.exceptions import DataValidationException
 
 logger = setup_logger(__name__)
 
+# Weeks start on Monday 00:00 UTC; 1970-01-05 is the first Monday after the epoch
+_DAY_SECONDS = 86400
+_WEEK_SECONDS = 7 * _DAY_SECONDS
+_EPOCH_MONDAY_SECONDS = 4 * _DAY_SECONDS
 
-def aggregate_to_weekly(daily_data: List[Dict]) -> List[Dict]:
+# Resample rule and aggregation used by the pandas fallback
+_WEEKLY_RULE = 'W-MON'
+_WEEKLY_AGGREGATION = MappingProxyType({
+    'open': 'first',    # First open of the week (Sunday midnight)
+    'high': 'max',      # Highest high of the week
+    'low': 'min',       # Lowest low of the week
+    'close': 'last',    # Last close of the week (Saturday close)
+    'volume': 'sum',    # Total volume for the week
+})
+
+
+def aggregate_to_weekly(
+    daily_data: Union[List[Dict], pd.DataFrame],
+    as_records: bool = True,
+) -> Union[List[Dict], Dict[str, Any]]:
     """
     Aggregate daily OHLCV data into weekly candles
     
@@ -18,75 +39,277 @@ def aggregate_to_weekly(daily_data: List[Dict]) -> List[Dict]:
     This means the first hourly candle of the week ends at Monday 1 AM
     
     Args:
-        daily_data: List of daily OHLCV dictionaries
+        daily_data: List of daily OHLCV dictionaries (or a daily DataFrame)
+        as_records: Return one dictionary per candle (default: True); if False,
+                    return columns instead: NumPy arrays for 'timestamp'
+                    (datetime64, UTC) and OHLCV, plus the 'symbol' string
+    
+    Returns:
+        List of weekly OHLCV dictionaries, or a dictionary of columns
+    
+    Raises:
+        DataValidationException: If data is invalid
+    """
+    if daily_data is None or len(daily_data) == 0:
+        logger.warning("Empty daily data provided")
+        return [] if as_records else {}
+    
+    weekly, symbol = _aggregate_weekly(daily_data)
+    
+    if not as_records:
+        return {
+            'timestamp': weekly['timestamp'].values,
+            **{col: weekly[col].to_numpy(dtype=np.float64) for col in _WEEKLY_AGGREGATION},
+            'symbol': symbol,
+        }
+    
+    # Convert to list of dicts (column-wise, no per-row Series boxing)
+    timestamps = np.char.add(
+        np.datetime_as_string(weekly['timestamp'].values.astype('datetime64[s]'), unit='s'),
+        '+00:00',
+    ).tolist()
+    values = weekly[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64).tolist()
+    
+    return [
+        {
+            'timestamp': ts,
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume,
+            'symbol': symbol,
+        }
+        for ts, (open_, high, low, close, volume) in zip(timestamps, values)
+    ]
+
+
+def aggregate_to_weekly_frame(daily_data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Aggregate daily OHLCV data into a weekly DataFrame ready for storage
+    Same candles as aggregate_to_weekly, without building per-candle
+    dictionaries that would only be turned back into a DataFrame
+    
+    Args:
+        daily_data: Daily DataFrame (or list of daily OHLCV dictionaries)
     
     Returns:
-        List of weekly OHLCV dictionaries
+        DataFrame with REQUIRED_COLUMNS and UTC timestamps (empty if no data)
     
     Raises:
         DataValidationException: If data is invalid
     """
-    if not daily_data:
+    if daily_data is None or len(daily_data) == 0:
         logger.warning("Empty daily data provided")
-        return []
+        return pd.DataFrame(columns=REQUIRED_COLUMNS)
+    
+    weekly, symbol = _aggregate_weekly(daily_data)
+    weekly['symbol'] = symbol
+    return weekly[REQUIRED_COLUMNS]
+
+
+def _aggregate_weekly(daily_data: Union[List[Dict], pd.DataFrame]) -> Tuple[pd.DataFrame, Any]:
+    """
+    Aggregate non-empty daily data into weekly OHLCV columns
+    
+    Args:
+        daily_data: List of daily OHLCV dictionaries, or a daily DataFrame
+    
+    Returns:
+        Tuple of (weekly DataFrame with timestamp and OHLCV columns, symbol)
     
+    Raises:
+        DataValidationException: If data is invalid
+    """
     # Convert to DataFrame
-    df = pd.DataFrame(daily_data)
+    df = daily_data if isinstance(daily_data, pd.DataFrame) else _daily_frame(daily_data)
     
     # Validate required columns
-    required = ["timestamp", "open", "high", "low", "close", "volume", "symbol"]
-    missing = set(required) - set(df.columns)
+    missing = REQUIRED_COLUMNS_SET.difference(df.columns)
     if missing:
         raise DataValidationException(f"Missing required columns: {missing}")
     
-    # Convert timestamp to datetime
-    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    # Convert timestamp to datetime (already parsed datetimes are only localized)
+    timestamps = df["timestamp"]
+    if not isinstance(timestamps.dtype, pd.DatetimeTZDtype) or str(timestamps.dt.tz) != "UTC":
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = (
+                timestamps.dt.tz_localize("UTC") if timestamps.dt.tz is None
+                else timestamps.dt.tz_convert("UTC")
+            )
+        else:
+            timestamps = pd.to_datetime(timestamps, utc=True, format="ISO8601", cache=True)
+        df = df.assign(timestamp=timestamps)
     
-    # Sort by timestamp
-    df = df.sort_values("timestamp")
+    # Sort by timestamp (daily data normally arrives already in order)
+    if not timestamps.is_monotonic_increasing:
+        df = df.sort_values("timestamp", kind="stable")
     
     # Get symbol (should be same for all rows)
     symbol = df["symbol"].iloc[0]
     
-    # Set timestamp as index
-    df = df.set_index("timestamp")
+    # Bucket whole weeks in one NumPy pass when the values are clean floats
+    weekly = _bucket_weekly(df)
+    if weekly is None:
+        weekly = _resample_weekly(df)
+    
+    logger.info(
+        "Aggregated %d daily candles into %d weekly candles (Sunday-Sunday)", len(df), len(weekly)
+    )
+    
+    return weekly, symbol
+
+
+def _daily_frame(daily_data: List[Dict]) -> pd.DataFrame:
+    """
+    Build the daily DataFrame column by column
+    OHLCV values are parsed straight into float64 arrays instead of going
+    through the dtype-inferring list-of-dicts constructor; rows with missing
+    keys fall back to it so the column check reports the problem
+    
+    Args:
+        daily_data: List of daily OHLCV dictionaries
+    
+    Returns:
+        DataFrame with the required columns (plus extra keys on fallback)
+    """
+    try:
+        columns = {col: [row[col] for row in daily_data] for col in REQUIRED_COLUMNS}
+    except (KeyError, TypeError):
+        return pd.DataFrame(daily_data)
+    
+    for col in ("open", "high", "low", "close", "volume"):
+        try:
+            columns[col] = np.fromiter(columns[col], dtype=np.float64, count=len(daily_data))
+        except (TypeError, ValueError):
+            # Left as-is; the aggregation falls back to pandas for these
+            pass
+    
+    return pd.DataFrame(columns)
+
+
+def aggregate_to_weekly_arrays(
+    timestamps: np.ndarray,
+    ohlcv: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Aggregate sorted daily candles held in NumPy arrays into weekly candles
+    Rows are assigned to Monday-to-Monday week buckets by integer division of
+    their epoch time, then each OHLCV column is reduced over the bucket
+    boundaries at once
+    
+    Args:
+        timestamps: Sorted datetime64 array of daily candle times (UTC)
+        ohlcv: Float array of shape (rows, 5): open, high, low, close, volume
+    
+    Returns:
+        Tuple of (week start times as datetime64 in the input unit,
+        weekly OHLCV array of shape (weeks, 5))
+    """
+    if not len(timestamps):
+        return timestamps[:0], np.empty((0, 5), dtype=np.float64)
+    
+    ohlcv = np.asarray(ohlcv, dtype=np.float64)
+    seconds = timestamps.astype('datetime64[s]').astype(np.int64)
+    starts = _week_start_rows(seconds)
+    ends = np.r_[starts[1:], len(seconds)] - 1
+    
+    # Week buckets counted from the first Monday of the Unix epoch
+    weeks = (seconds[starts] - _EPOCH_MONDAY_SECONDS) // _WEEK_SECONDS
+    week_starts = weeks * _WEEK_SECONDS + _EPOCH_MONDAY_SECONDS
+    
+    weekly = np.column_stack((
+        ohlcv[starts, 0],                          # First open of the week
+        np.maximum.reduceat(ohlcv[:, 1], starts),  # Highest high of the week
+        np.minimum.reduceat(ohlcv[:, 2], starts),  # Lowest low of the week
+        ohlcv[ends, 3],                            # Last close of the week
+        np.add.reduceat(ohlcv[:, 4], starts),      # Total volume for the week
+    ))
+    return week_starts.astype('datetime64[s]').astype(timestamps.dtype), weekly
+
+
+def _bucket_weekly(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Aggregate sorted daily rows into Monday-to-Monday weeks with NumPy
+    
+    Args:
+        df: Daily OHLCV DataFrame sorted by UTC timestamp
+    
+    Returns:
+        Weekly DataFrame (timestamp, open, high, low, close, volume), or None
+        if the values are not clean floats (use the pandas resample instead)
+    """
+    try:
+        values = df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    
+    if np.isnan(values).any():
+        return None
+    
+    week_starts, weekly = aggregate_to_weekly_arrays(df['timestamp'].values, values)
+    frame = pd.DataFrame(weekly, columns=['open', 'high', 'low', 'close', 'volume'])
+    frame.insert(0, 'timestamp', pd.DatetimeIndex(week_starts).tz_localize('UTC'))
+    return frame
+
+
+def _week_start_rows(seconds: np.ndarray) -> np.ndarray:
+    """
+    Find the first row of every week in sorted epoch timestamps
+    Gapless daily data (the common case) has a week start every 7 rows after
+    the first Monday, so the boundaries are computed arithmetically; input that
+    is already weekly maps row to row; other data compares the week number of
+    neighbouring rows
+    
+    Args:
+        seconds: Sorted Unix timestamps in seconds
+    
+    Returns:
+        Row indices where a new week begins (always starts with 0)
+    """
+    steps = np.diff(seconds)
+    
+    # Rows at least a week apart (e.g. data that is already weekly) are each
+    # their own week
+    if (steps >= _WEEK_SECONDS).all():
+        return np.arange(len(seconds))
+    
+    if (steps == _DAY_SECONDS).all():
+        first_week = (seconds[0] - _EPOCH_MONDAY_SECONDS) // _WEEK_SECONDS
+        next_monday = (first_week + 1) * _WEEK_SECONDS + _EPOCH_MONDAY_SECONDS
+        first_full = -(-(next_monday - seconds[0]) // _DAY_SECONDS)
+        return np.r_[0, np.arange(first_full, len(seconds), 7)]
+    
+    weeks = (seconds - _EPOCH_MONDAY_SECONDS) // _WEEK_SECONDS
+    return np.flatnonzero(np.r_[True, weeks[1:] != weeks[:-1]])
+
+
+def _resample_weekly(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate sorted daily rows into Monday-to-Monday weeks with pandas resample
+    
+    Args:
+        df: Daily OHLCV DataFrame sorted by UTC timestamp
+    
+    Returns:
+        Weekly DataFrame (timestamp, open, high, low, close, volume)
+    """
+    # Set timestamp as index, carrying only the numeric columns (the symbol
+    # is constant and added back by the caller)
+    df = df[['timestamp', *_WEEKLY_AGGREGATION]].set_index("timestamp")
     
     # Resample to weekly starting on Monday (matches TradingView's week start)
     # 'W-MON' groups Monday to Sunday and labels with the END (next Monday)
     # We use label='left' to label with the START of the week (Monday 00:00)
-    weekly = df.resample('W-MON', label='left', closed='left').agg({
-        'open': 'first',    # First open of the week (Sunday midnight)
-        'high': 'max',      # Highest high of the week
-        'low': 'min',       # Lowest low of the week
-        'close': 'last',    # Last close of the week (Saturday close)
-        'volume': 'sum',    # Total volume for the week
-    })
+    weekly = df.resample(_WEEKLY_RULE, label='left', closed='left').agg(
+        **{col: pd.NamedAgg(column=col, aggfunc=how) for col, how in _WEEKLY_AGGREGATION.items()}
+    )
     
     # Remove rows with NaN (incomplete weeks)
     weekly = weekly.dropna()
     
     # Reset index to get timestamp back as column
-    weekly = weekly.reset_index()
-    
-    # Add symbol column
-    weekly['symbol'] = symbol
-    
-    # Convert to list of dicts
-    weekly_data = []
-    for _, row in weekly.iterrows():
-        weekly_data.append({
-            'timestamp': row['timestamp'].isoformat(),
-            'open': float(row['open']),
-            'high': float(row['high']),
-            'low': float(row['low']),
-            'close': float(row['close']),
-            'volume': float(row['volume']),
-            'symbol': row['symbol'],
-        })
-    
-    logger.info(f"Aggregated {len(daily_data)} daily candles into {len(weekly_data)} weekly candles (Sunday-Sunday)")
-    
-    return weekly_data
+    return weekly.reset_index()
 
 
 def calculate_required_daily_candles(num_weekly_candles: int = None, start_year: int = None, end_year: int = None) -> int:
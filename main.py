@@ -5,35 +5,34 @@ Supports: 5m, 30m, 1h, 6h, 1d timeframes
 """
 import sys
 import pandas as pd
-from typing import List, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Optional
 
 from exchanges.coinbase import fetch_ohlcv as fetch_exchange, validate_symbol
 from exchanges.coinbase.advanced_trade import fetch_ohlcv_advanced
-from exchanges.coinbase.weekly_aggregator import aggregate_to_weekly, calculate_required_daily_candles
+from exchanges.coinbase.weekly_aggregator import aggregate_to_weekly_frame, calculate_required_daily_candles
 
 # TOGGLE: Set to True to use OAuth2, False for service account
 USE_OAUTH = True
-from drive.sheets import (
 
-        get_or_create_spreadsheet_in_folder,
-        ensure_timeframe_tables,
-        append_ohlcv_dataframe,
-    
-        get_spreadsheet_url,
-    )
+# The Google client libraries (gspread, googleapiclient, google-auth) are
+# only imported once an upload is requested, so local-only runs start faster
+if TYPE_CHECKING:
+    import gspread
 
-if USE_OAUTH:
-    from utils.oauth_auth import connect_gsheets_oauth
-    
-from drive.data_manager import rest_to_dataframe
+from drive.data_manager import rest_to_dataframe, validate_dataframe
 from storage.local_storage import LocalStorage
 from config.config import (
     DRIVE_FOLDER_ID,
     TF_SHEET_NAMES,
     LOCAL_DATA_DIR,
     ALL_TIMEFRAMES,
-    ADVANCED_TRADE_TIMEFRAMES,
+    ALL_TIMEFRAMES_SET,
+    ADVANCED_TRADE_TIMEFRAMES_SET,
+    AGGREGATED_TIMEFRAMES_SET,
     GRANULARITY_MAP,
+    COINBASE_MAX_CONCURRENT_TIMEFRAMES,
+    LOCAL_CSV_MAX_CONCURRENT_LOADS,
 )
 from utils.logger import setup_logger
 from utils.exceptions import (
@@ -87,6 +86,35 @@ def select_exchange() -> str:
         print("❌ Invalid exchange. Only 'coinbase' is supported.")
 
 
+def parse_year(value: str, label: str) -> Optional[int]:
+    """
+    Parse an optional year entered by the user
+    
+    Args:
+        value: Entered text (empty to skip)
+        label: Which year it is, for messages ('start' or 'end')
+    
+    Returns:
+        Year, or None if skipped
+    
+    Raises:
+        ValueError: If the year is not a number between 2010 and 2030
+    """
+    if not value:
+        return None
+    
+    try:
+        year = int(value)
+    except ValueError:
+        raise ValueError(f"Invalid {label} year: {value}. Must be a 4-digit year.")
+    
+    if year < 2010 or year > 2030:
+        raise ValueError(f"Invalid {label} year: {value}. {label.capitalize()} year must be between 2010 and 2030")
+    
+    logger.info("%s year: %s", label.capitalize(), year)
+    return year
+
+
 def get_user_inputs() -> Tuple[str, List[str], Optional[int], Optional[int]]:
     """
     Get trading pair, timeframes, start year, and end year from user
@@ -121,7 +149,7 @@ def get_user_inputs() -> Tuple[str, List[str], Optional[int], Optional[int]]:
     timeframes = [tf.strip() for tf in tf_input.split(",")]
     
     # Validate timeframes
-    invalid_tfs = [tf for tf in timeframes if tf not in ALL_TIMEFRAMES]
+    invalid_tfs = [tf for tf in timeframes if tf not in ALL_TIMEFRAMES_SET]
     if invalid_tfs:
         raise ValueError(
             f"Invalid timeframes: {', '.join(invalid_tfs)}. "
@@ -139,33 +167,18 @@ def get_user_inputs() -> Tuple[str, List[str], Optional[int], Optional[int]]:
     print("     • Start: (skip), End: 2024 → Fetches 2 years before 2024 to Dec 31, 2024")
     
     # Get start year
-    start_year_input = input("\nStart year (e.g., 2022) [Press Enter to skip]: ").strip()
-    start_year = None
-    if start_year_input:
-        try:
-            start_year = int(start_year_input)
-            if start_year < 2010 or start_year > 2030:
-                raise ValueError("Start year must be between 2010 and 2030")
-            logger.info(f"Start year: {start_year}")
-        except ValueError as e:
-            raise ValueError(f"Invalid start year: {start_year_input}. Must be a 4-digit year.")
+    start_year = parse_year(
+        input("\nStart year (e.g., 2022) [Press Enter to skip]: ").strip(), "start"
+    )
     
     # Get end year
-    end_year_input = input("End year (e.g., 2024) [Press Enter to skip]: ").strip()
-    end_year = None
-    if end_year_input:
-        try:
-            end_year = int(end_year_input)
-            if end_year < 2010 or end_year > 2030:
-                raise ValueError("End year must be between 2010 and 2030")
-            
-            # Validate year range
-            if start_year and end_year < start_year:
-                raise ValueError(f"End year ({end_year}) cannot be before start year ({start_year})")
-            
-            logger.info(f"End year: {end_year}")
-        except ValueError as e:
-            raise ValueError(f"Invalid end year: {end_year_input}. Must be a 4-digit year.")
+    end_year = parse_year(
+        input("End year (e.g., 2024) [Press Enter to skip]: ").strip(), "end"
+    )
+    
+    # Validate year range
+    if start_year and end_year and end_year < start_year:
+        raise ValueError(f"End year ({end_year}) cannot be before start year ({start_year})")
     
     # Display selected range
     if start_year and end_year:
@@ -206,6 +219,472 @@ def ask_drive_upload() -> bool:
             print("Please enter 'y' for yes or 'n' for no")
 
 
+def resolve_date_range(
+    start_year: Optional[int],
+    end_year: Optional[int],
+) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """
+    Resolve the requested years to a UTC date range
+    Matches the range fetched by the Exchange API: a start year alone runs
+    to now, an end year alone starts 2 years before it
+    
+    Args:
+        start_year: Optional start year
+        end_year: Optional end year
+    
+    Returns:
+        Tuple of (start, end) UTC Timestamps, or (None, None) if no years given
+    """
+    if not start_year and not end_year:
+        return None, None
+    
+    if start_year:
+        required_start = pd.Timestamp(year=start_year, month=1, day=1, tz='UTC')
+    else:
+        required_start = pd.Timestamp(year=end_year - 2, month=1, day=1, tz='UTC')
+    
+    if end_year:
+        required_end = pd.Timestamp(year=end_year, month=12, day=31, hour=23, minute=59, second=59, tz='UTC')
+    else:
+        required_end = pd.Timestamp.now(tz='UTC')
+    
+    return required_start, required_end
+
+
+def is_already_stored(
+    local_storage: LocalStorage,
+    exchange: str,
+    pair: str,
+    tf: str,
+    raw_data: List[dict],
+) -> bool:
+    """
+    Check whether fetched candles are all present in the local CSV already
+    Only the CSV's first and last rows and its line count are read: the
+    candles are stored if they fall before the last stored candle (which
+    may have been saved while still forming) and the CSV has no gaps
+    
+    Args:
+        local_storage: LocalStorage instance
+        exchange: Exchange name
+        pair: Trading pair
+        tf: Timeframe
+        raw_data: OHLCV dictionaries returned by the API
+    
+    Returns:
+        True if saving the candles would add or change nothing
+    """
+    stored_range = local_storage.get_csv_date_range(exchange, pair, tf)
+    if stored_range is None or tf not in GRANULARITY_MAP:
+        return False
+    
+    first, last = stored_range
+    timestamps = [candle["timestamp"] for candle in raw_data]
+    fetched_first = pd.to_datetime(min(timestamps), utc=True)
+    fetched_last = pd.to_datetime(max(timestamps), utc=True)
+    
+    if fetched_first < first or fetched_last >= last:
+        return False
+    
+    expected_rows = int((last - first).total_seconds()) // GRANULARITY_MAP[tf] + 1
+    return local_storage.count_csv_rows(exchange, pair, tf) == expected_rows
+
+
+def fetch_and_store_timeframe(
+    fetch,
+    api_name: str,
+    tf: str,
+    pair: str,
+    exchange: str,
+    start_year: Optional[int],
+    end_year: Optional[int],
+    local_storage: LocalStorage,
+) -> Tuple[int, List[str], bool]:
+    """
+    Fetch one timeframe from the API and save it to the local CSV
+    Runs on a worker thread, so console output is collected and returned
+    for the caller to print as one block
+    
+    Args:
+        fetch: Fetch function (fetch_exchange or fetch_ohlcv_advanced)
+        api_name: API name for log messages
+        tf: Timeframe
+        pair: Trading pair
+        exchange: Exchange name
+        start_year: Optional start year
+        end_year: Optional end year
+        local_storage: LocalStorage instance
+    
+    Returns:
+        Tuple of (new rows saved, console lines, whether candles were
+        fetched and stored without error)
+    """
+    lines = [f"\n⏳ Processing {tf.upper()} timeframe..."]
+    
+    try:
+        # Fetch data from the API
+        logger.info("Fetching %s data from %s...", tf, api_name)
+        raw_data = fetch(
+            symbol=pair,
+            timeframe=tf,
+            start_year=start_year,
+            end_year=end_year,
+        )
+        
+        if not raw_data:
+            lines.append(f"  ⚠️  No data returned from API")
+            return 0, lines, False
+        
+        lines.append(f"  📥 Fetched {len(raw_data)} candles from API")
+        
+        # Skip the DataFrame build and CSV rewrite when nothing is new
+        if is_already_stored(local_storage, exchange, pair, tf, raw_data):
+            csv_path = local_storage.get_csv_path(exchange, pair, tf)
+            lines.append(f"  ℹ️  No new data (all existing in: {csv_path.name})")
+            lines.append(f"     Full path: {csv_path}")
+            return 0, lines, True
+        
+        # Convert to DataFrame
+        logger.info("Converting to DataFrame...")
+        df = rest_to_dataframe(raw_data)
+        
+        if df.empty:
+            lines.append(f"  ⚠️  No valid data after processing")
+            return 0, lines, False
+        
+        # Reject candles that break OHLCV invariants before merging them
+        validate_dataframe(df)
+        
+        lines.append(f"  ✅ Processed {len(df)} valid candles")
+        
+        # Save to local CSV
+        logger.info("Saving to local CSV...")
+        csv_path = local_storage.get_csv_path(exchange, pair, tf)
+        logger.info("Target CSV path: %s", csv_path)
+        
+        added = local_storage.save_csv(
+            df=df,
+            exchange=exchange,
+            pair=pair,
+            timeframe=tf,
+            deduplicate=True,
+        )
+        
+        if added > 0:
+            lines.append(f"  ✅ Saved {added} new rows to: {csv_path.name}")
+            lines.append(f"     Full path: {csv_path}")
+        else:
+            lines.append(f"  ℹ️  No new data (all existing in: {csv_path.name})")
+            lines.append(f"     Full path: {csv_path}")
+        
+        return added, lines, True
+        
+    except APIException as e:
+        lines.append(f"  ❌ API Error for {tf}: {str(e)}")
+        logger.error("API error for %s: %s", tf, e)
+    except DataValidationException as e:
+        lines.append(f"  ❌ Data Validation Error for {tf}: {str(e)}")
+        logger.error("Data validation error for %s: %s", tf, e)
+    except Exception as e:
+        lines.append(f"  ❌ Error for {tf}: {str(e)}")
+        logger.error("Error for %s: %s", tf, e)
+    
+    return 0, lines, False
+
+
+def aggregate_and_store_weekly(
+    tf: str,
+    pair: str,
+    exchange: str,
+    start_year: Optional[int],
+    end_year: Optional[int],
+    local_storage: LocalStorage,
+    daily_prefetch: Optional[Future] = None,
+    daily_fetched: bool = False,
+) -> Tuple[int, List[str]]:
+    """
+    Build one weekly timeframe from daily data and save it to the local CSV
+    Daily candles are fetched first if the local 1d CSV does not cover the
+    requested range; console output is collected and returned like
+    fetch_and_store_timeframe does
+    
+    Args:
+        tf: Weekly timeframe (e.g., '1w')
+        pair: Trading pair
+        exchange: Exchange name
+        start_year: Optional start year
+        end_year: Optional end year
+        local_storage: LocalStorage instance
+        daily_prefetch: Optional future of the daily CSV read (see prefetch_csv)
+        daily_fetched: Whether this run already fetched and stored 1d candles
+                       for the same date range without error (they are not
+                       fetched again)
+    
+    Returns:
+        Tuple of (new rows saved, console lines)
+    """
+    lines = [f"\n⏳ Processing {tf.upper()} timeframe..."]
+    
+    # Date range the daily data must cover (None, None: any range is fine)
+    required_start, required_end = resolve_date_range(start_year, end_year)
+    
+    try:
+        # Calculate required daily candles for the requested date range
+        if start_year or end_year:
+            num_daily = calculate_required_daily_candles(
+                start_year=start_year,
+                end_year=end_year
+            )
+            lines.append(f"  📊 Need ~{num_daily} daily candles for {start_year or 'start'} to {end_year or 'now'}")
+        else:
+            # Default to ~100 weekly candles = ~700 daily
+            num_daily = 700
+            lines.append(f"  📊 Need ~{num_daily} daily candles (default range)")
+        
+        # Check if we have daily data
+        daily_csv_path = local_storage.get_csv_path(exchange, pair, '1d')
+        should_fetch = False
+        
+        if not daily_csv_path.exists():
+            lines.append(f"  ⚠️  Daily (1d) data not found - need to fetch")
+            should_fetch = True
+        else:
+            # Read only the first and last rows to check date range coverage
+            lines.append(f"  📁 Checking existing daily data coverage...")
+            daily_range = local_storage.get_csv_date_range(exchange, pair, '1d')
+            
+            if daily_range is None:
+                lines.append(f"  ⚠️  Daily CSV is empty - need to fetch")
+                should_fetch = True
+            else:
+                # Check date range coverage
+                existing_start, existing_end = daily_range
+                
+                lines.append(f"  📅 Existing data: {existing_start.strftime('%Y-%m-%d')} to {existing_end.strftime('%Y-%m-%d')}")
+                
+                # Check if existing data covers required range
+                if required_start and required_end:
+                    lines.append(f"  📅 Required data: {required_start.strftime('%Y-%m-%d')} to {required_end.strftime('%Y-%m-%d')}")
+                    
+                    # Allow some tolerance (7 days on each end)
+                    start_gap = (existing_start - required_start).days
+                    end_gap = (required_end - existing_end).days
+                    
+                    if start_gap > 7:
+                        lines.append(f"  ⚠️  Missing data at start: {abs(start_gap)} days gap")
+                        should_fetch = True
+                    elif end_gap > 7:
+                        lines.append(f"  ⚠️  Missing data at end: {end_gap} days gap")
+                        should_fetch = True
+                    else:
+                        lines.append(f"  ✅ Existing data covers requested range")
+                        should_fetch = False
+                else:
+                    # No specific range required, use existing
+                    lines.append(f"  ✅ Using existing daily data (no specific range requested)")
+                    should_fetch = False
+        
+        # The 1d timeframe was fetched for the same range earlier in this run;
+        # fetching again would only return the same candles
+        if should_fetch and daily_fetched and daily_csv_path.exists():
+            lines.append(f"  ℹ️  Daily data was just fetched for this range (not fetching again)")
+            should_fetch = False
+        
+        # Fetch daily data if needed
+        if should_fetch:
+            lines.append(f"  🌐 Fetching {num_daily} daily candles from API...")
+            logger.info("Fetching %d daily candles for weekly aggregation...", num_daily)
+            
+            # Fetch daily data
+            raw_daily = fetch_exchange(
+                symbol=pair,
+                timeframe='1d',
+                num_candles=num_daily,
+                start_year=start_year,
+                end_year=end_year,
+            )
+            
+            if not raw_daily:
+                lines.append(f"  ❌ Failed to fetch daily data - cannot create weekly")
+                return 0, lines
+            
+            lines.append(f"  📥 Fetched {len(raw_daily)} daily candles from API")
+            
+            # Convert to DataFrame
+            df_daily = rest_to_dataframe(raw_daily)
+            if not df_daily.empty:
+                validate_dataframe(df_daily)
+            
+            # Save daily data (will merge with existing if any)
+            added = local_storage.save_csv(
+                df=df_daily,
+                exchange=exchange,
+                pair=pair,
+                timeframe='1d',
+                deduplicate=True,
+            )
+            lines.append(f"  💾 Saved {added} new daily candles to: {daily_csv_path.name}")
+        
+        # Load the daily data (merged with any fresh fetch) for aggregation;
+        # the prefetched copy is current unless daily data was just fetched
+        if should_fetch or daily_prefetch is None:
+            df_daily = local_storage.load_csv(exchange, pair, '1d')
+        else:
+            df_daily = daily_prefetch.result()
+        
+        # At this point df_daily should be loaded (either existing or freshly fetched)
+        if df_daily is None or df_daily.empty:
+            lines.append(f"  ❌ No daily data available - cannot aggregate")
+            return 0, lines
+        
+        lines.append(f"  ✅ Using {len(df_daily)} daily candles for aggregation")
+        
+        # Aggregate to weekly straight from the DataFrame
+        logger.info("Aggregating daily data to weekly...")
+        df_weekly = aggregate_to_weekly_frame(df_daily)
+        
+        if df_weekly.empty:
+            lines.append(f"  ⚠️  No weekly data generated from aggregation")
+            return 0, lines
+        
+        lines.append(f"  🔄 Aggregated {len(df_daily)} daily → {len(df_weekly)} weekly candles")
+        
+        # Save to local CSV
+        logger.info("Saving weekly data to local CSV...")
+        csv_path = local_storage.get_csv_path(exchange, pair, tf)
+        
+        added = local_storage.save_csv(
+            df=df_weekly,
+            exchange=exchange,
+            pair=pair,
+            timeframe=tf,
+            deduplicate=True,
+        )
+        
+        if added > 0:
+            lines.append(f"  ✅ Saved {added} new rows to: {csv_path.name}")
+            lines.append(f"     Full path: {csv_path}")
+        else:
+            lines.append(f"  ℹ️  No new data (all existing in: {csv_path.name})")
+            lines.append(f"     Full path: {csv_path}")
+        
+        return added, lines
+        
+    except APIException as e:
+        lines.append(f"  ❌ API Error for {tf}: {str(e)}")
+        logger.error("API error for %s: %s", tf, e)
+    except DataValidationException as e:
+        lines.append(f"  ❌ Data Validation Error for {tf}: {str(e)}")
+        logger.error("Data validation error for %s: %s", tf, e)
+    except Exception as e:
+        lines.append(f"  ❌ Error for {tf}: {str(e)}")
+        logger.error("Error for %s: %s", tf, e)
+    
+    return 0, lines
+
+
+def prefetch_csv(
+    local_storage: LocalStorage,
+    exchange: str,
+    pair: str,
+    tf: str,
+    after: Optional[Future] = None,
+) -> Optional[pd.DataFrame]:
+    """
+    Load a local CSV on a worker thread so the read overlaps other fetches
+    
+    Args:
+        local_storage: LocalStorage instance
+        exchange: Exchange name
+        pair: Trading pair
+        tf: Timeframe
+        after: Optional future of the job that updates this CSV; the file
+               is only read once that job has finished
+    
+    Returns:
+        DataFrame if the CSV exists, None otherwise
+    """
+    if after is not None:
+        after.result()
+    return local_storage.load_csv(exchange, pair, tf)
+
+
+def prepare_spreadsheet(
+    client,
+    creds,
+    exchange: str,
+    pair: str,
+    timeframes: List[str],
+) -> Tuple["gspread.Spreadsheet", Dict[str, "gspread.Worksheet"]]:
+    """
+    Get or create the pair's spreadsheet and its timeframe worksheets
+    
+    Args:
+        client: Google Sheets client
+        creds: Google credentials
+        exchange: Exchange name
+        pair: Trading pair
+        timeframes: List of timeframes
+    
+    Returns:
+        Tuple of (spreadsheet, mapping of tab name to worksheet)
+    """
+    from drive.sheets import get_or_create_spreadsheet_in_folder, ensure_timeframe_tables
+    
+    # Get or create spreadsheet
+    logger.info("Setting up spreadsheet for %s(%s)...", exchange, pair)
+    spreadsheet = get_or_create_spreadsheet_in_folder(
+        client=client,
+        creds=creds,
+        exchange=exchange,
+        pair=pair,
+        folder_id=DRIVE_FOLDER_ID,
+    )
+    
+    # Ensure timeframe worksheets exist
+    logger.info("Setting up timeframe worksheets...")
+    worksheets = ensure_timeframe_tables(spreadsheet, timeframes)
+    
+    return spreadsheet, worksheets
+
+
+def load_upload_frame(
+    local_storage: LocalStorage,
+    exchange: str,
+    pair: str,
+    tf: str,
+    lines: List[str],
+) -> Optional[pd.DataFrame]:
+    """
+    Load a timeframe's local CSV for upload
+    
+    Args:
+        local_storage: LocalStorage instance
+        exchange: Exchange name
+        pair: Trading pair
+        tf: Timeframe
+        lines: Output lines of the timeframe (progress is appended)
+    
+    Returns:
+        Local DataFrame, or None if it is empty or cannot be loaded
+    """
+    try:
+        # Load from local CSV
+        df = local_storage.load_csv(exchange, pair, tf)
+        
+        if df is None or df.empty:
+            lines.append(f"  ⚠️  Local CSV is empty for {tf} (skipping)")
+            return None
+        
+        lines.append(f"  📁 Loaded {len(df)} rows from local CSV")
+        return df
+        
+    except Exception as e:
+        lines.append(f"  ❌ Upload Error for {tf}: {str(e)}")
+        logger.error("Upload error for %s: %s", tf, e)
+        return None
+
+
 def upload_to_drive(
     local_storage: LocalStorage,
     exchange: str,
@@ -213,6 +692,7 @@ def upload_to_drive(
     timeframes: List[str],
     client,
     creds,
+    available: Optional[Set[str]] = None,
 ) -> None:
     """
     Upload local CSV data to Google Drive
@@ -224,75 +704,115 @@ def upload_to_drive(
         timeframes: List of timeframes
         client: Google Sheets client
         creds: Google credentials
+        available: Optional timeframes known to have a local CSV
+                   (see LocalStorage.list_available)
     """
+    from drive.sheets import append_many, get_spreadsheet_url
+    
+    if available is None:
+        available = local_storage.list_available(exchange, pair)
+    
     print("\n📤 Uploading to Google Drive...")
     print_separator()
     
-    # Get or create spreadsheet
-    logger.info(f"Setting up spreadsheet for {exchange}({pair})...")
-    spreadsheet = get_or_create_spreadsheet_in_folder(
-        client=client,
-        creds=creds,
-        exchange=exchange,
-        pair=pair,
-        folder_id=DRIVE_FOLDER_ID,
-    )
+    # Set up the spreadsheet in the background while the local CSVs are loaded
+    # (concurrently: parsing releases the GIL for most of its work)
+    with ThreadPoolExecutor(max_workers=1 + LOCAL_CSV_MAX_CONCURRENT_LOADS) as executor:
+        setup = executor.submit(prepare_spreadsheet, client, creds, exchange, pair, timeframes)
+        
+        loads = {}
+        tf_lines = {}
+        unchanged = {}
+        
+        for tf in timeframes:
+            lines = tf_lines[tf] = [f"\n📤 Preparing {tf.upper()} data..."]
+            
+            # Check if CSV exists first
+            if tf not in available:
+                lines.append(f"  ⚠️  No local CSV file found for {tf} (skipping)")
+                continue
+            
+            # Files not modified since their last upload are not loaded
+            unchanged[tf] = local_storage.get_unchanged_targets(exchange, pair, tf)
+            if unchanged[tf]:
+                continue
+            
+            loads[tf] = executor.submit(load_upload_frame, local_storage, exchange, pair, tf, lines)
+        
+        local_frames = {}
+        for tf, job in loads.items():
+            df = job.result()
+            if df is not None:
+                local_frames[tf] = df
+        
+        spreadsheet, worksheets = setup.result()
+    
+    # Files unchanged since an upload to another spreadsheet still need loading
+    for tf, targets in unchanged.items():
+        if targets and spreadsheet.id not in targets:
+            df = load_upload_frame(local_storage, exchange, pair, tf, tf_lines[tf])
+            if df is not None:
+                local_frames[tf] = df
     
     spreadsheet_url = get_spreadsheet_url(spreadsheet)
     print(f"✅ Spreadsheet ready: {spreadsheet.title}")
     print(f"   URL: {spreadsheet_url}")
-    
-    # Ensure timeframe worksheets exist
-    logger.info("Setting up timeframe worksheets...")
-    ensure_timeframe_tables(spreadsheet, timeframes)
     print("✅ Timeframe worksheets verified")
     
     print_separator()
     
-    # Upload data for each timeframe
+    # Collect the unsynced rows of each timeframe
     total_uploaded = 0
+    upload_frames = {}
     
     for tf in timeframes:
-        print(f"\n📤 Uploading {tf.upper()} data...")
+        print("\n".join(tf_lines[tf]))
+        
+        if spreadsheet.id in unchanged.get(tf, ()):
+            print(f"  ℹ️  Local CSV unchanged since last upload (0 new rows)")
+            continue
+        
+        if tf not in local_frames:
+            continue
+        
+        # Only rows outside the range already synced to this spreadsheet
+        upload_df = local_storage.filter_unsynced(local_frames[tf], exchange, pair, tf, spreadsheet.id)
+        
+        if upload_df.empty:
+            print(f"  ℹ️  All data already exists in Drive (0 new rows)")
+            continue
+        
+        upload_frames[tf] = upload_df
+    
+    # Append every timeframe in one read and one write request
+    if upload_frames:
+        print(f"\n📤 Uploading {', '.join(tf.upper() for tf in upload_frames)} data...")
+        logger.info(
+            "Uploading data to worksheets %s...",
+            ", ".join(TF_SHEET_NAMES[tf] for tf in upload_frames),
+        )
         
         try:
-            # Check if CSV exists first
-            if not local_storage.csv_exists(exchange, pair, tf):
-                print(f"  ⚠️  No local CSV file found for {tf} (skipping)")
-                continue
-            
-            # Load from local CSV
-            df = local_storage.load_csv(exchange, pair, tf)
-            
-            if df is None or df.empty:
-                print(f"  ⚠️  Local CSV is empty for {tf} (skipping)")
-                continue
-            
-            print(f"  📁 Loaded {len(df)} rows from local CSV")
-            
-            # Append to worksheet
-            ws_name = TF_SHEET_NAMES[tf]
-            worksheet = spreadsheet.worksheet(ws_name)
-            
-            logger.info(f"Uploading data to worksheet {ws_name}...")
-            
-            added = append_ohlcv_dataframe(
-                worksheet=worksheet,
-                df=df,
+            appended = append_many(
+                spreadsheet=spreadsheet,
+                frames=upload_frames,
                 index_col="timestamp",
-                batch_size=100,
+                worksheets=worksheets,
             )
             
-            if added > 0:
-                print(f"  ✅ Uploaded {added} new rows to {ws_name}")
-                total_uploaded += added
-            else:
-                print(f"  ℹ️  All data already exists in Drive (0 new rows)")
+            for tf, added in appended.items():
+                ws_name = TF_SHEET_NAMES[tf]
+                local_storage.save_sync_state(local_frames[tf], exchange, pair, tf, spreadsheet.id)
+                
+                if added > 0:
+                    print(f"  ✅ Uploaded {added} new rows to {ws_name}")
+                    total_uploaded += added
+                else:
+                    print(f"  ℹ️  {ws_name}: all data already exists in Drive (0 new rows)")
             
         except Exception as e:
-            print(f"  ❌ Upload Error for {tf}: {str(e)}")
-            logger.error(f"Upload error for {tf}: {str(e)}")
-            continue
+            print(f"  ❌ Upload Error: {str(e)}")
+            logger.error("Upload error: %s", e)
     
     # Summary
     print_separator()
@@ -332,7 +852,7 @@ def main():
         print_separator()
         
         # Validate trading pair
-        logger.info(f"Validating trading pair: {pair}")
+        logger.info("Validating trading pair: %s", pair)
         if not validate_symbol(pair):
             raise ValueError(
                 f"Trading pair '{pair}' not found on {exchange.capitalize()}. "
@@ -341,11 +861,17 @@ def main():
         
         # Separate timeframes by source
         # Exchange API: any TF present in GRANULARITY_MAP that isn't handled by another source
-        exchange_tfs = [tf for tf in timeframes if tf in GRANULARITY_MAP and tf not in ADVANCED_TRADE_TIMEFRAMES and tf != '1w']
-        advanced_tfs = [tf for tf in timeframes if tf in ADVANCED_TRADE_TIMEFRAMES]
-        weekly_tfs = [tf for tf in timeframes if tf == '1w']
+        exchange_tfs = [
+            tf for tf in timeframes
+            if tf in GRANULARITY_MAP and tf not in ADVANCED_TRADE_TIMEFRAMES_SET and tf not in AGGREGATED_TIMEFRAMES_SET
+        ]
+        advanced_tfs = [tf for tf in timeframes if tf in ADVANCED_TRADE_TIMEFRAMES_SET]
+        weekly_tfs = [tf for tf in timeframes if tf in AGGREGATED_TIMEFRAMES_SET]
 
-        logger.info(f"Timeframe routing — Exchange API: {exchange_tfs}, Advanced Trade: {advanced_tfs}, Weekly: {weekly_tfs}")
+        logger.info(
+            "Timeframe routing — Exchange API: %s, Advanced Trade: %s, Weekly: %s",
+            exchange_tfs, advanced_tfs, weekly_tfs,
+        )
         print(f"\n📋 Timeframe routing:")
         print(f"   Exchange API (direct fetch): {', '.join(exchange_tfs) if exchange_tfs else 'none'}")
         print(f"   Advanced Trade API:          {', '.join(advanced_tfs) if advanced_tfs else 'none'}")
@@ -357,317 +883,58 @@ def main():
         print("\n📥 FETCHING & STORING DATA LOCALLY")
         print("=" * 70)
         
-        # Process Exchange API timeframes (5m, 1h, 6h, 1d)
-        if exchange_tfs:
-            print("\n🔹 Processing EXCHANGE API timeframes...")
+        # Fetch Exchange API (5m, 1h, 6h, 1d) and Advanced Trade API (30m)
+        # timeframes concurrently; each API's rate limiter paces its requests
+        api_jobs = [(fetch_exchange, "Exchange API", tf) for tf in exchange_tfs]
+        api_jobs += [(fetch_ohlcv_advanced, "Advanced Trade API", tf) for tf in advanced_tfs]
+        
+        daily_prefetch = None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(COINBASE_MAX_CONCURRENT_TIMEFRAMES, len(api_jobs)))) as executor:
+            futures = [
+                executor.submit(
+                    fetch_and_store_timeframe,
+                    fetch, api_name, tf, pair, exchange, start_year, end_year, local_storage,
+                )
+                for fetch, api_name, tf in api_jobs
+            ]
             
-            for tf in exchange_tfs:
-                print(f"\n⏳ Processing {tf.upper()} timeframe...")
-                
-                try:
-                    # Fetch data from exchange
-                    logger.info(f"Fetching {tf} data from {exchange} Exchange API...")
-                    raw_data = fetch_exchange(
-                        symbol=pair,
-                        timeframe=tf,
-                        start_year=start_year,
-                        end_year=end_year,
-                    )
-                    
-                    if not raw_data:
-                        print(f"  ⚠️  No data returned from API")
-                        continue
-                    
-                    print(f"  📥 Fetched {len(raw_data)} candles from API")
-                    
-                    # Convert to DataFrame
-                    logger.info("Converting to DataFrame...")
-                    df = rest_to_dataframe(raw_data)
-                    
-                    if df.empty:
-                        print(f"  ⚠️  No valid data after processing")
-                        continue
-                    
-                    print(f"  ✅ Processed {len(df)} valid candles")
-                    
-                    # Save to local CSV
-                    logger.info(f"Saving to local CSV...")
-                    csv_path = local_storage.get_csv_path(exchange, pair, tf)
-                    logger.info(f"Target CSV path: {csv_path}")
-                    
-                    added = local_storage.save_csv(
-                        df=df,
-                        exchange=exchange,
-                        pair=pair,
-                        timeframe=tf,
-                        deduplicate=True,
-                    )
-                    
-                    if added > 0:
-                        print(f"  ✅ Saved {added} new rows to: {csv_path.name}")
-                        print(f"     Full path: {csv_path}")
-                        total_new_rows += added
-                    else:
-                        print(f"  ℹ️  No new data (all existing in: {csv_path.name})")
-                        print(f"     Full path: {csv_path}")
-                    
-                except APIException as e:
-                    print(f"  ❌ API Error for {tf}: {str(e)}")
-                    logger.error(f"API error for {tf}: {str(e)}")
-                    continue
-                except DataValidationException as e:
-                    print(f"  ❌ Data Validation Error for {tf}: {str(e)}")
-                    logger.error(f"Data validation error for {tf}: {str(e)}")
-                    continue
-                except Exception as e:
-                    print(f"  ❌ Error for {tf}: {str(e)}")
-                    logger.error(f"Error for {tf}: {str(e)}")
-                    continue
-        
-        # Process Advanced Trade API timeframes (30m)
-        if advanced_tfs:
-            print("\n🔸 Processing ADVANCED TRADE API timeframes...")
-            print("   (Direct API fetch - no data generation)")
+            # Read the daily CSV for weekly aggregation while the remaining
+            # requests are in flight (after the 1d job has updated it, if any)
+            if weekly_tfs:
+                daily_job = futures[exchange_tfs.index('1d')] if '1d' in exchange_tfs else None
+                daily_prefetch = executor.submit(
+                    prefetch_csv, local_storage, exchange, pair, '1d', daily_job,
+                )
             
-            for tf in advanced_tfs:
-                print(f"\n⏳ Processing {tf.upper()} timeframe...")
+            # Report each timeframe as one block, in the usual order
+            for idx, future in enumerate(futures):
+                if idx == 0 and exchange_tfs:
+                    print("\n🔹 Processing EXCHANGE API timeframes...")
+                if idx == len(exchange_tfs) and advanced_tfs:
+                    print("\n🔸 Processing ADVANCED TRADE API timeframes...")
+                    print("   (Direct API fetch - no data generation)")
                 
-                try:
-                    # Fetch directly from Advanced Trade API
-                    logger.info(f"Fetching {tf} data from Advanced Trade API...")
-                    raw_data = fetch_ohlcv_advanced(
-                        symbol=pair,
-                        timeframe=tf,
-                        start_year=start_year,
-                        end_year=end_year,
-                    )
-                    
-                    if not raw_data:
-                        print(f"  ⚠️  No data returned from API")
-                        continue
-                    
-                    print(f"  📥 Fetched {len(raw_data)} candles from API")
-                    
-                    # Convert to DataFrame
-                    logger.info("Converting to DataFrame...")
-                    df = rest_to_dataframe(raw_data)
-                    
-                    if df.empty:
-                        print(f"  ⚠️  No valid data after processing")
-                        continue
-                    
-                    print(f"  ✅ Processed {len(df)} valid candles")
-                    
-                    # Save to local CSV
-                    logger.info(f"Saving to local CSV...")
-                    csv_path = local_storage.get_csv_path(exchange, pair, tf)
-                    logger.info(f"Target CSV path: {csv_path}")
-                    
-                    added = local_storage.save_csv(
-                        df=df,
-                        exchange=exchange,
-                        pair=pair,
-                        timeframe=tf,
-                        deduplicate=True,
-                    )
-                    
-                    if added > 0:
-                        print(f"  ✅ Saved {added} new rows to: {csv_path.name}")
-                        print(f"     Full path: {csv_path}")
-                        total_new_rows += added
-                    else:
-                        print(f"  ℹ️  No new data (all existing in: {csv_path.name})")
-                        print(f"     Full path: {csv_path}")
-                    
-                except APIException as e:
-                    print(f"  ❌ API Error for {tf}: {str(e)}")
-                    logger.error(f"API error for {tf}: {str(e)}")
-                    continue
-                except DataValidationException as e:
-                    print(f"  ❌ Data Validation Error for {tf}: {str(e)}")
-                    logger.error(f"Data validation error for {tf}: {str(e)}")
-                    continue
-                except Exception as e:
-                    print(f"  ❌ Error for {tf}: {str(e)}")
-                    logger.error(f"Error for {tf}: {str(e)}")
-                    continue
+                added, lines, _ = future.result()
+                print("\n".join(lines))
+                total_new_rows += added
         
         # Process Weekly timeframes (1w) - requires aggregation from daily data
         if weekly_tfs:
+            # Only a 1d job that finished without error may stand in for the
+            # weekly step's own daily fetch
+            daily_fetched = daily_job is not None and daily_job.result()[2]
+            
             print("\n🔷 Processing WEEKLY AGGREGATION timeframes...")
             print("   (Aggregated from daily 1d data)")
             
             for tf in weekly_tfs:
-                print(f"\n⏳ Processing {tf.upper()} timeframe...")
-                
-                try:
-                    # Calculate required daily candles for the requested date range
-                    if start_year or end_year:
-                        num_daily = calculate_required_daily_candles(
-                            start_year=start_year,
-                            end_year=end_year
-                        )
-                        print(f"  📊 Need ~{num_daily} daily candles for {start_year or 'start'} to {end_year or 'now'}")
-                    else:
-                        # Default to ~100 weekly candles = ~700 daily
-                        num_daily = 700
-                        print(f"  📊 Need ~{num_daily} daily candles (default range)")
-                    
-                    # Check if we have daily data
-                    daily_csv_path = local_storage.get_csv_path(exchange, pair, '1d')
-                    should_fetch = False
-                    
-                    if not daily_csv_path.exists():
-                        print(f"  ⚠️  Daily (1d) data not found - need to fetch")
-                        should_fetch = True
-                    else:
-                        # Load existing daily data to check date range coverage
-                        print(f"  📁 Checking existing daily data coverage...")
-                        df_daily = local_storage.load_csv(exchange, pair, '1d')
-                        
-                        if df_daily is None or df_daily.empty:
-                            print(f"  ⚠️  Daily CSV is empty - need to fetch")
-                            should_fetch = True
-                        else:
-                            # Check date range coverage
-                            existing_start = df_daily['timestamp'].min()
-                            existing_end = df_daily['timestamp'].max()
-                            
-                            print(f"  📅 Existing data: {existing_start.strftime('%Y-%m-%d')} to {existing_end.strftime('%Y-%m-%d')} ({len(df_daily)} candles)")
-                            
-                            # Determine required date range
-                            from datetime import datetime
-                            if start_year and end_year:
-                                required_start = pd.Timestamp(datetime(start_year, 1, 1), tz='UTC')
-                                required_end = pd.Timestamp(datetime(end_year, 12, 31, 23, 59, 59), tz='UTC')
-                            elif start_year:
-                                required_start = pd.Timestamp(datetime(start_year, 1, 1), tz='UTC')
-                                required_end = pd.Timestamp(datetime.utcnow(), tz='UTC')
-                            elif end_year:
-                                required_start = pd.Timestamp(datetime(end_year - 2, 1, 1), tz='UTC')
-                                required_end = pd.Timestamp(datetime(end_year, 12, 31, 23, 59, 59), tz='UTC')
-                            else:
-                                # No year range, existing data is fine
-                                required_start = None
-                                required_end = None
-                            
-                            # Check if existing data covers required range
-                            if required_start and required_end:
-                                print(f"  📅 Required data: {required_start.strftime('%Y-%m-%d')} to {required_end.strftime('%Y-%m-%d')}")
-                                
-                                # Allow some tolerance (7 days on each end)
-                                start_gap = (existing_start - required_start).days
-                                end_gap = (required_end - existing_end).days
-                                
-                                if start_gap > 7:
-                                    print(f"  ⚠️  Missing data at start: {abs(start_gap)} days gap")
-                                    should_fetch = True
-                                elif end_gap > 7:
-                                    print(f"  ⚠️  Missing data at end: {end_gap} days gap")
-                                    should_fetch = True
-                                else:
-                                    print(f"  ✅ Existing data covers requested range")
-                                    should_fetch = False
-                            else:
-                                # No specific range required, use existing
-                                print(f"  ✅ Using existing daily data (no specific range requested)")
-                                should_fetch = False
-                    
-                    # Fetch daily data if needed
-                    if should_fetch:
-                        print(f"  🌐 Fetching {num_daily} daily candles from API...")
-                        logger.info(f"Fetching {num_daily} daily candles for weekly aggregation...")
-                        
-                        # Fetch daily data
-                        raw_daily = fetch_exchange(
-                            symbol=pair,
-                            timeframe='1d',
-                            num_candles=num_daily,
-                            start_year=start_year,
-                            end_year=end_year,
-                        )
-                        
-                        if not raw_daily:
-                            print(f"  ❌ Failed to fetch daily data - cannot create weekly")
-                            continue
-                        
-                        print(f"  📥 Fetched {len(raw_daily)} daily candles from API")
-                        
-                        # Convert to DataFrame
-                        df_daily = rest_to_dataframe(raw_daily)
-                        
-                        # Save daily data (will merge with existing if any)
-                        added = local_storage.save_csv(
-                            df=df_daily,
-                            exchange=exchange,
-                            pair=pair,
-                            timeframe='1d',
-                            deduplicate=True,
-                        )
-                        print(f"  💾 Saved {added} new daily candles to: {daily_csv_path.name}")
-                        
-                        # Reload to get merged data
-                        df_daily = local_storage.load_csv(exchange, pair, '1d')
-                    
-                    # At this point df_daily should be loaded (either existing or freshly fetched)
-                    if df_daily is None or df_daily.empty:
-                        print(f"  ❌ No daily data available - cannot aggregate")
-                        continue
-                    
-                    print(f"  ✅ Using {len(df_daily)} daily candles for aggregation")
-                    
-                    # Convert DataFrame back to list of dicts for aggregation
-                    logger.info("Aggregating daily data to weekly...")
-                    daily_data = df_daily.to_dict('records')
-                    
-                    # Aggregate to weekly
-                    weekly_data = aggregate_to_weekly(daily_data)
-                    
-                    if not weekly_data:
-                        print(f"  ⚠️  No weekly data generated from aggregation")
-                        continue
-                    
-                    print(f"  🔄 Aggregated {len(df_daily)} daily → {len(weekly_data)} weekly candles")
-                    
-                    # Convert to DataFrame
-                    df_weekly = rest_to_dataframe(weekly_data)
-                    
-                    if df_weekly.empty:
-                        print(f"  ⚠️  No valid weekly data after processing")
-                        continue
-                    
-                    # Save to local CSV
-                    logger.info(f"Saving weekly data to local CSV...")
-                    csv_path = local_storage.get_csv_path(exchange, pair, tf)
-                    
-                    added = local_storage.save_csv(
-                        df=df_weekly,
-                        exchange=exchange,
-                        pair=pair,
-                        timeframe=tf,
-                        deduplicate=True,
-                    )
-                    
-                    if added > 0:
-                        print(f"  ✅ Saved {added} new rows to: {csv_path.name}")
-                        print(f"     Full path: {csv_path}")
-                        total_new_rows += added
-                    else:
-                        print(f"  ℹ️  No new data (all existing in: {csv_path.name})")
-                        print(f"     Full path: {csv_path}")
-                    
-                except APIException as e:
-                    print(f"  ❌ API Error for {tf}: {str(e)}")
-                    logger.error(f"API error for {tf}: {str(e)}")
-                    continue
-                except DataValidationException as e:
-                    print(f"  ❌ Data Validation Error for {tf}: {str(e)}")
-                    logger.error(f"Data validation error for {tf}: {str(e)}")
-                    continue
-                except Exception as e:
-                    print(f"  ❌ Error for {tf}: {str(e)}")
-                    logger.error(f"Error for {tf}: {str(e)}")
-                    continue
+                added, lines = aggregate_and_store_weekly(
+                    tf, pair, exchange, start_year, end_year, local_storage, daily_prefetch,
+                    daily_fetched=daily_fetched,
+                )
+                print("\n".join(lines))
+                total_new_rows += added
         
         # Local storage summary
         print_separator()
@@ -677,14 +944,16 @@ def main():
         print(f"   Total new rows saved: {total_new_rows}")
         
         # Ask if user wants to upload to Drive (only if we have data)
-        if total_new_rows > 0 or any(local_storage.csv_exists(exchange, pair, tf) for tf in timeframes):
+        available = local_storage.list_available(exchange, pair)
+        if total_new_rows > 0 or not available.isdisjoint(timeframes):
             if ask_drive_upload():
                 try:
                     # Connect to Google Sheets
                     logger.info("Connecting to Google Sheets API...")
                     
                     if USE_OAUTH:
-                        client, creds = connect_gsheets_oauth()
+                        from utils.oauth_auth import get_gsheets_client
+                        client, creds = get_gsheets_client()
                         print("✅ Connected via OAuth2 (your Google account)")
                     else:
                         pass
@@ -696,18 +965,19 @@ def main():
                         timeframes=timeframes,
                         client=client,
                         creds=creds,
+                        available=available,
                     )
                     
                 except GoogleSheetsException as e:
                     print(f"\n❌ Google Sheets Error:")
                     print(f"   {str(e)}")
                     print("\n💡 Your data is still saved locally!")
-                    logger.error(f"Google Sheets error: {str(e)}")
+                    logger.error("Google Sheets error: %s", e)
                 except StorageQuotaException as e:
                     print(f"\n❌ Storage Quota Error:")
                     print(f"   {str(e)}")
                     print("\n💡 Your data is still saved locally!")
-                    logger.error(f"Storage quota exceeded: {str(e)}")
+                    logger.error("Storage quota exceeded: %s", e)
             else:
                 print("\n✅ Data saved locally only (Drive upload skipped)")
         else:
@@ -721,7 +991,7 @@ def main():
     except ValueError as e:
         print(f"\n❌ Validation Error:")
         print(f"   {str(e)}")
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         sys.exit(1)
         
     except KeyboardInterrupt:
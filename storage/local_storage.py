@@ -2,16 +2,64 @@
 Local Storage Manager
 Handles saving OHLCV data to local CSV files with deduplication
 """
+import io
 import os
+import csv
+import json
+import shutil
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from utils.logger import setup_logger
 from utils.exceptions import DataValidationException
-from config.config import REQUIRED_COLUMNS
+from config.config import REQUIRED_COLUMNS_SET, LOCAL_CSV_CACHE_SIZE
 
 logger = setup_logger(__name__)
 
+# pyarrow's multithreaded CSV reader parses large files several times
+# faster (timestamps included); fall back to pandas' C parser without it
+try:
+    import pyarrow
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
+
+
+@lru_cache(maxsize=LOCAL_CSV_CACHE_SIZE)
+def _read_csv_cached(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """
+    Parse a CSV file once per version of the file
+    The modification time and size are part of the cache key, so rewriting
+    the file invalidates its entry
+    
+    Args:
+        path: Path to CSV file
+        mtime_ns: File modification time (ns) when read
+        size: File size (bytes) when read
+    
+    Returns:
+        Parsed DataFrame with UTC timestamps (must not be modified)
+    
+    Raises:
+        DataValidationException: If required columns are missing
+    """
+    df = pd.read_csv(path, engine=_CSV_ENGINE)
+    
+    # Validate structure
+    missing = REQUIRED_COLUMNS_SET.difference(df.columns)
+    if missing:
+        raise DataValidationException(
+            f"CSV file missing columns: {missing}"
+        )
+    
+    # Convert timestamp to datetime (files are written with ISO 8601
+    # timestamps, which parse much faster than with format inference)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, format="ISO8601")
+    
+    return df
+
 
 class LocalStorage:
     """Manages local CSV storage for OHLCV data"""
@@ -25,11 +73,16 @@ class LocalStorage:
         """
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(exist_ok=True)
-        logger.info(f"Local storage initialized at: {self.base_dir.absolute()}")
+        
+        # Exchange directories already created (see get_exchange_dir)
+        self._exchange_dirs: Dict[str, Path] = {}
+        logger.info("Local storage initialized at: %s", self.base_dir.absolute())
     
     def get_exchange_dir(self, exchange: str) -> Path:
         """
         Get or create exchange directory
+        The directory is created on first use only, so path lookups made
+        for every timeframe do not each cost a mkdir system call
         
         Args:
             exchange: Exchange name (e.g., 'coinbase')
@@ -37,8 +90,11 @@ class LocalStorage:
         Returns:
             Path to exchange directory
         """
-        exchange_dir = self.base_dir / exchange.lower()
-        exchange_dir.mkdir(exist_ok=True)
+        exchange_dir = self._exchange_dirs.get(exchange)
+        if exchange_dir is None:
+            exchange_dir = self.base_dir / exchange.lower()
+            exchange_dir.mkdir(exist_ok=True)
+            self._exchange_dirs[exchange] = exchange_dir
         return exchange_dir
     
     def get_csv_path(self, exchange: str, pair: str, timeframe: str) -> Path:
@@ -76,9 +132,32 @@ class LocalStorage:
         csv_path = self.get_csv_path(exchange, pair, timeframe)
         return csv_path.exists()
     
+    def list_available(self, exchange: str, pair: str) -> Set[str]:
+        """
+        Get the timeframes that have a CSV file for a pair
+        Uses a single directory scan instead of one existence check per timeframe
+        
+        Args:
+            exchange: Exchange name
+            pair: Trading pair
+        
+        Returns:
+            Set of timeframes (e.g., {'1h', '1d'})
+        """
+        prefix = f"{pair.replace('/', '-').upper()}_"
+        
+        with os.scandir(self.get_exchange_dir(exchange)) as entries:
+            return {
+                entry.name[len(prefix):-len(".csv")]
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".csv") and entry.is_file()
+            }
+    
     def load_csv(self, exchange: str, pair: str, timeframe: str) -> Optional[pd.DataFrame]:
         """
         Load existing CSV file
+        Parsed files are cached until the file is modified, so loading the
+        same file again (e.g. for upload after aggregation) skips the parse
         
         Args:
             exchange: Exchange name
@@ -91,31 +170,127 @@ class LocalStorage:
         csv_path = self.get_csv_path(exchange, pair, timeframe)
         
         if not csv_path.exists():
-            logger.info(f"CSV file does not exist: {csv_path}")
+            logger.info("CSV file does not exist: %s", csv_path)
             return None
         
         try:
-            df = pd.read_csv(csv_path)
-            logger.info(f"Loaded {len(df)} rows from: {csv_path.name}")
+            stat = csv_path.stat()
+            df = _read_csv_cached(str(csv_path), stat.st_mtime_ns, stat.st_size)
+            logger.info("Loaded %d rows from: %s", len(df), csv_path.name)
             
-            # Validate structure
-            if not all(col in df.columns for col in REQUIRED_COLUMNS):
-                missing = set(REQUIRED_COLUMNS) - set(df.columns)
-                raise DataValidationException(
-                    f"CSV file missing columns: {missing}"
-                )
+            # Callers may modify the frame; the cached one stays untouched
+            return df.copy()
             
-            # Convert timestamp to datetime
-            df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        except Exception as e:
+            logger.error("Failed to load CSV %s: %s", csv_path, e)
+            raise DataValidationException(
+                f"Failed to load CSV: {str(e)}"
+            )
+    
+    def get_csv_date_range(
+        self,
+        exchange: str,
+        pair: str,
+        timeframe: str,
+    ) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Get the first and last timestamp of a CSV file without loading it
+        CSV files are written sorted by timestamp, so only the header, the
+        first data row and the last line are read
+        
+        Args:
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+        
+        Returns:
+            Tuple of (first, last) UTC Timestamps, or None if the file
+            does not exist or has no data rows
+        
+        Raises:
+            DataValidationException: If the file cannot be read
+        """
+        csv_path = self.get_csv_path(exchange, pair, timeframe)
+        
+        if not csv_path.exists():
+            return None
+        
+        try:
+            with open(csv_path, "rb") as f:
+                header = f.readline()
+                first_row = f.readline()
+                if not first_row.strip():
+                    return None
+                last_row = self._read_last_line(f)
             
-            return df
+            columns = next(csv.reader([header.decode("utf-8")]))
+            if "timestamp" not in columns:
+                raise DataValidationException("CSV file missing columns: {'timestamp'}")
+            ts_idx = columns.index("timestamp")
             
+            first = next(csv.reader([first_row.decode("utf-8")]))[ts_idx]
+            last = next(csv.reader([last_row.decode("utf-8")]))[ts_idx]
+            return (
+                pd.to_datetime(first, utc=True),
+                pd.to_datetime(last, utc=True),
+            )
+            
+        except DataValidationException:
+            raise
         except Exception as e:
-            logger.error(f"Failed to load CSV {csv_path}: {str(e)}")
+            logger.error("Failed to read date range of %s: %s", csv_path, e)
             raise DataValidationException(
-                f"Failed to load CSV: {str(e)}"
+                f"Failed to read CSV date range: {str(e)}"
             )
     
+    def count_csv_rows(self, exchange: str, pair: str, timeframe: str) -> int:
+        """
+        Count the data rows of a CSV file without parsing it
+        
+        Args:
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+        
+        Returns:
+            Number of data rows (0 if the file does not exist)
+        """
+        csv_path = self.get_csv_path(exchange, pair, timeframe)
+        
+        if not csv_path.exists():
+            return 0
+        
+        lines = 0
+        last_block = b""
+        with open(csv_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                lines += block.count(b"\n")
+                last_block = block
+        
+        # Count a final line without a trailing newline
+        if last_block and not last_block.endswith(b"\n"):
+            lines += 1
+        
+        return max(lines - 1, 0)
+    
+    @staticmethod
+    def _read_last_line(f, block_size: int = 4096) -> bytes:
+        """Read the last non-empty line of a binary file by seeking from the end"""
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        tail = b""
+        
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            lines = tail.rstrip(b"\r\n").rsplit(b"\n", 1)
+            if len(lines) == 2 or position == 0:
+                return lines[-1]
+        
+        return tail
+    
     def save_csv(
         self,
         df: pd.DataFrame,
@@ -145,7 +320,7 @@ class LocalStorage:
             return 0
         
         # Validate columns
-        missing = set(REQUIRED_COLUMNS) - set(df.columns)
+        missing = REQUIRED_COLUMNS_SET.difference(df.columns)
         if missing:
             raise DataValidationException(
                 f"Missing required columns: {missing}"
@@ -153,38 +328,63 @@ class LocalStorage:
         
         csv_path = self.get_csv_path(exchange, pair, timeframe)
         
-        # Ensure timestamp is datetime
-        df = df.copy()
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        # Ensure timestamp is datetime (assign builds a new frame that shares
+        # the other columns, so the caller's frame is left untouched without
+        # copying every column)
+        df = df.assign(timestamp=pd.to_datetime(df["timestamp"], utc=True, cache=True))
+        
+        # Only the rows at or after the earliest new timestamp can change, so
+        # when those are a tail of the file just that tail is re-encoded (on
+        # a copy of the file, which then replaces it atomically)
+        if deduplicate and csv_path.exists():
+            tail = self._read_csv_tail(csv_path, df["timestamp"].min())
+            
+            if tail is not None and set(tail[1].columns) == set(df.columns):
+                offset, existing_tail = tail
+                merged_tail = self._merge_frames(existing_tail, df)
+                new_rows = len(merged_tail) - len(existing_tail)
+                
+                try:
+                    tmp_path = csv_path.with_suffix(".tmp")
+                    shutil.copyfile(csv_path, tmp_path)
+                    with open(tmp_path, "r+b") as f:
+                        f.seek(offset)
+                        f.truncate()
+                        f.write(
+                            merged_tail[list(existing_tail.columns)]
+                            .to_csv(header=False, index=False)
+                            .encode("utf-8")
+                        )
+                    os.replace(tmp_path, csv_path)
+                    logger.info(
+                        "Rewrote last %d rows as %d (%d new) in: %s",
+                        len(existing_tail), len(merged_tail), new_rows, csv_path.name,
+                    )
+                    return new_rows
+                    
+                except Exception as e:
+                    logger.error("Failed to save CSV %s: %s", csv_path, e)
+                    raise DataValidationException(
+                        f"Failed to save CSV: {str(e)}"
+                    )
+        
+        # Otherwise splice the new rows in between the existing lines; only the
+        # key columns of the existing rows are parsed
+        if deduplicate and csv_path.exists():
+            new_rows = self._splice_rows(csv_path, df)
+            if new_rows is not None:
+                return new_rows
         
         # Load existing data if deduplication is enabled
         if deduplicate and csv_path.exists():
             existing_df = self.load_csv(exchange, pair, timeframe)
             
             if existing_df is not None and not existing_df.empty:
-                logger.info(f"Merging with {len(existing_df)} existing rows")
-                
-                # Combine dataframes
-                combined_df = pd.concat([existing_df, df], ignore_index=True)
-                
-                # Remove duplicates based on timestamp and symbol
-                initial_count = len(combined_df)
-                combined_df = combined_df.drop_duplicates(
-                    subset=["timestamp", "symbol"],
-                    keep="last"
-                )
-                duplicates_removed = initial_count - len(combined_df)
-                
-                if duplicates_removed > 0:
-                    logger.info(f"Removed {duplicates_removed} duplicate rows")
-                
-                # Sort by timestamp
-                combined_df = combined_df.sort_values("timestamp").reset_index(drop=True)
-                
-                new_rows = len(combined_df) - len(existing_df)
-                df = combined_df
+                df = self._merge_frames(existing_df, df)
+                new_rows = len(df) - len(existing_df)
             else:
                 new_rows = len(df)
+                df = df.sort_values("timestamp").reset_index(drop=True)
         else:
             new_rows = len(df)
             # Sort by timestamp
@@ -194,16 +394,475 @@ class LocalStorage:
         try:
             df.to_csv(csv_path, index=False)
             logger.info(
-                f"Saved {len(df)} total rows ({new_rows} new) to: {csv_path.name}"
+                "Saved %d total rows (%d new) to: %s", len(df), new_rows, csv_path.name
             )
             return new_rows
             
         except Exception as e:
-            logger.error(f"Failed to save CSV {csv_path}: {str(e)}")
+            logger.error("Failed to save CSV %s: %s", csv_path, e)
             raise DataValidationException(
                 f"Failed to save CSV: {str(e)}"
             )
     
+    @staticmethod
+    def _splice_rows(csv_path: Path, df: pd.DataFrame) -> Optional[int]:
+        """
+        Merge new rows into a sorted CSV file by splicing raw lines
+        Only the timestamp and symbol columns of the existing rows are parsed;
+        existing lines are copied byte for byte, except those replaced by a
+        new row with the same timestamp, and the file is replaced atomically
+        
+        Args:
+            csv_path: Path to CSV file (sorted by timestamp)
+            df: New rows with UTC timestamps
+        
+        Returns:
+            Number of new rows added, or None if the file's layout is
+            unexpected (merge through full DataFrames instead)
+        
+        Raises:
+            DataValidationException: If the file cannot be written
+        """
+        try:
+            data = csv_path.read_bytes()
+            header_end = data.find(b"\n") + 1
+            columns = next(csv.reader([data[:header_end].decode("utf-8")]))
+            
+            if set(columns) != set(df.columns) or not data.endswith(b"\n"):
+                return None
+            
+            existing = pd.read_csv(
+                io.BytesIO(data),
+                usecols=["timestamp", "symbol"],
+                dtype={"symbol": "category"},
+            )
+        except (OSError, ValueError, StopIteration) as e:
+            logger.warning("Falling back to full merge of %s: %s", csv_path.name, e)
+            return None
+        
+        # Line start offsets (rows are single lines), plus the end of the file
+        newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord("\n"))
+        if len(newlines) != len(existing) + 1 or existing.empty:
+            return None
+        row_starts = newlines + 1
+        
+        symbols = existing["symbol"].cat.categories.union(df["symbol"].unique())
+        existing_ts = pd.to_datetime(existing["timestamp"], utc=True, format="ISO8601")
+        if len(symbols) != 1 or not existing_ts.is_monotonic_increasing:
+            return None
+        
+        df = df.drop_duplicates(subset="timestamp", keep="last")
+        if not df["timestamp"].is_monotonic_increasing:
+            df = df.sort_values("timestamp", kind="stable")
+        
+        # Where each new row goes among the existing rows, and whether it
+        # replaces the existing row at that position
+        existing_values = existing_ts.values
+        new_values = df["timestamp"].values
+        positions = np.searchsorted(existing_values, new_values)
+        in_range = positions < len(existing_values)
+        replaces = np.zeros(len(df), dtype=bool)
+        replaces[in_range] = existing_values[positions[in_range]] == new_values[in_range]
+        
+        new_lines = df[columns].to_csv(header=False, index=False).encode("utf-8").splitlines(keepends=True)
+        
+        parts = [data[:header_end]]
+        copied = 0
+        for position, replace, line in zip(positions.tolist(), replaces.tolist(), new_lines):
+            parts.append(data[row_starts[copied]:row_starts[position]] if position > copied else b"")
+            parts.append(line)
+            copied = position + 1 if replace else position
+        parts.append(data[row_starts[copied]:])
+        
+        new_rows = len(df) - int(replaces.sum())
+        
+        try:
+            tmp_path = csv_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.writelines(parts)
+            os.replace(tmp_path, csv_path)
+            logger.info(
+                "Saved %d total rows (%d new) to: %s",
+                len(existing) + new_rows, new_rows, csv_path.name,
+            )
+            return new_rows
+            
+        except Exception as e:
+            logger.error("Failed to save CSV %s: %s", csv_path, e)
+            raise DataValidationException(
+                f"Failed to save CSV: {str(e)}"
+            )
+    
+    @staticmethod
+    def _merge_frames(existing_df: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge new rows into existing rows, new values winning on duplicates
+        Files hold a single pair, so duplicates are normally found by hashing
+        the timestamps alone rather than whole (timestamp, symbol) rows
+        
+        Args:
+            existing_df: Existing rows
+            df: New rows
+        
+        Returns:
+            Merged DataFrame sorted by timestamp
+        """
+        logger.info("Merging with %d existing rows", len(existing_df))
+        
+        symbols = pd.concat([existing_df["symbol"], df["symbol"]], ignore_index=True).unique()
+        if len(symbols) == 1 and existing_df["timestamp"].is_monotonic_increasing:
+            # Existing rows replaced by a new row with the same timestamp
+            df = df.drop_duplicates(subset="timestamp", keep="last")
+            if not df["timestamp"].is_monotonic_increasing:
+                df = df.sort_values("timestamp", kind="stable")
+            replaced = LocalStorage._sorted_matches(
+                existing_df["timestamp"].values, df["timestamp"].values
+            )
+            
+            if replaced.any():
+                logger.info("Removed %d duplicate rows", int(replaced.sum()))
+            
+            # Both sides are sorted, so merge them instead of sorting
+            return LocalStorage._merge_sorted(existing_df[~replaced], df)
+        
+        # Combine dataframes
+        combined_df = pd.concat([existing_df, df], ignore_index=True)
+        
+        # Remove duplicates based on timestamp and symbol
+        initial_count = len(combined_df)
+        combined_df = combined_df.drop_duplicates(
+            subset=["timestamp", "symbol"],
+            keep="last"
+        )
+        duplicates_removed = initial_count - len(combined_df)
+        
+        if duplicates_removed > 0:
+            logger.info("Removed %d duplicate rows", duplicates_removed)
+        
+        # Sort by timestamp
+        return combined_df.sort_values("timestamp").reset_index(drop=True)
+    
+    @staticmethod
+    def _sorted_matches(values: np.ndarray, keys: np.ndarray) -> np.ndarray:
+        """
+        Flag the values that are also keys, for two sorted arrays
+        Only values within the keys' range are binary-searched, so rows far
+        from the new data are never hashed or compared
+        
+        Args:
+            values: Sorted array to flag
+            keys: Sorted, non-empty array to look up
+        
+        Returns:
+            Boolean mask over values
+        """
+        matches = np.zeros(len(values), dtype=bool)
+        lo = int(np.searchsorted(values, keys[0], side="left"))
+        hi = int(np.searchsorted(values, keys[-1], side="right"))
+        
+        window = values[lo:hi]
+        positions = np.minimum(np.searchsorted(keys, window), len(keys) - 1)
+        matches[lo:hi] = keys[positions] == window
+        return matches
+    
+    @staticmethod
+    def _merge_sorted(existing_df: pd.DataFrame, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merge two timestamp-sorted DataFrames with no timestamps in common
+        The new rows' final positions come from one searchsorted over the
+        existing timestamps, so no full sort of the combined rows is needed
+        
+        Args:
+            existing_df: Existing rows, sorted by timestamp
+            df: New rows, sorted by timestamp
+        
+        Returns:
+            Merged DataFrame sorted by timestamp
+        """
+        existing_count = len(existing_df)
+        total = existing_count + len(df)
+        
+        # Position of each new row in the merged order
+        new_positions = np.searchsorted(
+            existing_df["timestamp"].values, df["timestamp"].values
+        ) + np.arange(len(df))
+        
+        is_new = np.zeros(total, dtype=bool)
+        is_new[new_positions] = True
+        take = np.empty(total, dtype=np.intp)
+        take[new_positions] = np.arange(existing_count, total)
+        take[~is_new] = np.arange(existing_count)
+        
+        combined_df = pd.concat([existing_df, df], ignore_index=True)
+        return combined_df.take(take).reset_index(drop=True)
+    
+    @staticmethod
+    def _read_csv_tail(
+        csv_path: Path,
+        since: pd.Timestamp,
+        block_size: int = 1 << 16,
+    ) -> Optional[Tuple[int, pd.DataFrame]]:
+        """
+        Read the rows of a sorted CSV file from the first row at or after a timestamp
+        The file is read backwards in growing blocks, so the cost depends on
+        the size of the tail rather than the size of the file
+        
+        Args:
+            csv_path: Path to CSV file (sorted by timestamp)
+            since: Earliest timestamp of the rows about to be merged
+            block_size: Size of the first block read from the end
+        
+        Returns:
+            Tuple of (byte offset of the tail, tail rows), or None if the tail
+            would be over half the file or the file's layout is unexpected
+        """
+        try:
+            with open(csv_path, "rb") as f:
+                header = f.readline()
+                data_start = f.tell()
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                max_tail = max(block_size, (position - data_start) // 2)
+                
+                columns = next(csv.reader([header.decode("utf-8")]))
+                if position == data_start or "timestamp" not in columns:
+                    return None
+                ts_idx = columns.index("timestamp")
+                
+                tail = b""
+                while position > data_start:
+                    step = min(block_size, position - data_start)
+                    position -= step
+                    f.seek(position)
+                    tail = f.read(step) + tail
+                    block_size *= 2
+                    
+                    # Past half the file, splicing the lines is cheaper
+                    if len(tail) > max_tail:
+                        return None
+                    
+                    # Stop once the first complete line is older than the new rows
+                    line_start = 0 if position == data_start else tail.find(b"\n") + 1
+                    line_end = tail.find(b"\n", line_start)
+                    if (line_start == 0 and position > data_start) or line_end < 0:
+                        continue
+                    first_line = tail[line_start:line_end].decode("utf-8")
+                    if pd.to_datetime(next(csv.reader([first_line]))[ts_idx], utc=True) < since:
+                        break
+                else:
+                    # No existing row is older: the tail is the whole file
+                    return None
+            
+            chunk = tail[line_start:]
+            if not chunk.endswith(b"\n"):
+                return None
+            
+            existing = pd.read_csv(io.BytesIO(header + chunk), float_precision="round_trip")
+            if not REQUIRED_COLUMNS_SET.issubset(existing.columns):
+                return None
+            existing["timestamp"] = pd.to_datetime(
+                existing["timestamp"], utc=True, format="ISO8601"
+            )
+            
+            # Line start offsets (rows are single lines)
+            newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == ord("\n"))
+            if len(newlines) != len(existing):
+                return None
+            row_starts = np.concatenate(([0], newlines + 1))
+            
+            first_row = int(existing["timestamp"].searchsorted(since, side="left"))
+            offset = position + line_start + int(row_starts[first_row])
+            if offset == data_start:
+                return None
+            
+            return offset, existing.iloc[first_row:].reset_index(drop=True)
+            
+        except (OSError, ValueError, StopIteration) as e:
+            logger.warning("Falling back to full rewrite of %s: %s", csv_path.name, e)
+            return None
+    
+    def get_sync_state_path(self, exchange: str) -> Path:
+        """
+        Get path of the upload sync state file for an exchange
+        Format: data/{exchange}/sync_state.json
+        
+        Args:
+            exchange: Exchange name
+        
+        Returns:
+            Path to sync state file
+        """
+        return self.get_exchange_dir(exchange) / "sync_state.json"
+    
+    def load_sync_state(
+        self,
+        exchange: str,
+        pair: str,
+        timeframe: str,
+        target: str,
+    ) -> Optional[Dict]:
+        """
+        Load the range of local data last uploaded to a target
+        
+        Args:
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+            target: Upload target identifier (e.g., spreadsheet ID)
+        
+        Returns:
+            Dict with 'first', 'last' (UTC Timestamps) and 'rows',
+            or None if nothing was synced yet
+        """
+        state_path = self.get_sync_state_path(exchange)
+        if not state_path.exists():
+            return None
+        
+        try:
+            with open(state_path, "r") as f:
+                states = json.load(f)
+            state = states.get(self._sync_key(pair, timeframe, target))
+            if state is None:
+                return None
+            return {
+                "first": pd.Timestamp(state["first"]),
+                "last": pd.Timestamp(state["last"]),
+                "rows": int(state["rows"]),
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable sync state %s: %s", state_path.name, e)
+            return None
+    
+    def save_sync_state(
+        self,
+        df: pd.DataFrame,
+        exchange: str,
+        pair: str,
+        timeframe: str,
+        target: str,
+    ) -> None:
+        """
+        Record the range of local data that is now present in a target
+        
+        Args:
+            df: Full local DataFrame that was synced
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+            target: Upload target identifier (e.g., spreadsheet ID)
+        """
+        if df.empty:
+            return
+        
+        state_path = self.get_sync_state_path(exchange)
+        states = {}
+        if state_path.exists():
+            try:
+                with open(state_path, "r") as f:
+                    states = json.load(f)
+            except (OSError, ValueError):
+                states = {}
+        
+        timestamps = pd.to_datetime(df["timestamp"], utc=True)
+        state = {
+            "first": timestamps.min().isoformat(),
+            "last": timestamps.max().isoformat(),
+            "rows": len(df),
+        }
+        
+        # Fingerprint of the synced file, to skip it while it is unchanged
+        csv_path = self.get_csv_path(exchange, pair, timeframe)
+        if csv_path.exists():
+            stat = csv_path.stat()
+            state["mtime_ns"] = stat.st_mtime_ns
+            state["size"] = stat.st_size
+        
+        states[self._sync_key(pair, timeframe, target)] = state
+        
+        tmp_path = state_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(states, f, indent=2)
+        os.replace(tmp_path, state_path)
+    
+    def get_unchanged_targets(self, exchange: str, pair: str, timeframe: str) -> Set[str]:
+        """
+        Get the targets a CSV file was synced to and not modified since
+        Only the file's modification time and size are checked, so the file
+        is not read
+        
+        Args:
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+        
+        Returns:
+            Set of upload target identifiers (e.g., spreadsheet IDs)
+        """
+        state_path = self.get_sync_state_path(exchange)
+        csv_path = self.get_csv_path(exchange, pair, timeframe)
+        if not state_path.exists() or not csv_path.exists():
+            return set()
+        
+        try:
+            with open(state_path, "r") as f:
+                states = json.load(f)
+            stat = csv_path.stat()
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable sync state %s: %s", state_path.name, e)
+            return set()
+        
+        prefix = self._sync_key(pair, timeframe, "")
+        return {
+            key[len(prefix):]
+            for key, state in states.items()
+            if key.startswith(prefix)
+            and state.get("mtime_ns") == stat.st_mtime_ns
+            and state.get("size") == stat.st_size
+        }
+    
+    def filter_unsynced(
+        self,
+        df: pd.DataFrame,
+        exchange: str,
+        pair: str,
+        timeframe: str,
+        target: str,
+    ) -> pd.DataFrame:
+        """
+        Drop rows already uploaded to a target, using the local sync state
+        Rows outside the last synced range are returned; if the number of
+        local rows inside that range changed (e.g. a gap was filled), the
+        whole DataFrame is returned so the target can deduplicate it
+        
+        Args:
+            df: Full local DataFrame
+            exchange: Exchange name
+            pair: Trading pair
+            timeframe: Timeframe
+            target: Upload target identifier (e.g., spreadsheet ID)
+        
+        Returns:
+            DataFrame with rows that may be missing from the target
+        """
+        state = self.load_sync_state(exchange, pair, timeframe, target)
+        if state is None or df.empty:
+            return df
+        
+        timestamps = pd.to_datetime(df["timestamp"], utc=True)
+        inside = (timestamps >= state["first"]) & (timestamps <= state["last"])
+        
+        if int(inside.sum()) != state["rows"]:
+            logger.info("Local data changed inside synced range, uploading all rows")
+            return df
+        
+        return df[~inside]
+    
+    @staticmethod
+    def _sync_key(pair: str, timeframe: str, target: str) -> str:
+        """Build the sync state key for a pair/timeframe/target"""
+        clean_pair = pair.replace("/", "-").upper()
+        return f"{clean_pair}_{timeframe}@{target}"
+    
     def get_all_csv_files(self, exchange: Optional[str] = None) -> List[Path]:
         """
         Get list of all CSV files
@@ -231,22 +890,32 @@ class LocalStorage:
     def get_storage_stats(self) -> dict:
         """
         Get statistics about local storage
+        Walks the directories with os.scandir, whose entries carry the file
+        type, so no Path objects are built and only CSV files are stat'ed
         
         Returns:
             Dictionary with storage statistics
         """
-        all_files = self.get_all_csv_files()
-        
-        total_size = sum(f.stat().st_size for f in all_files)
+        total_files = 0
+        total_size = 0
         
         # Count by exchange
         exchange_counts = {}
-        for f in all_files:
-            exchange = f.parent.name
-            exchange_counts[exchange] = exchange_counts.get(exchange, 0) + 1
+        with os.scandir(self.base_dir) as exchange_dirs:
+            for exchange_dir in exchange_dirs:
+                if not exchange_dir.is_dir():
+                    continue
+                
+                with os.scandir(exchange_dir.path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".csv") or not entry.is_file():
+                            continue
+                        total_files += 1
+                        total_size += entry.stat().st_size
+                        exchange_counts[exchange_dir.name] = exchange_counts.get(exchange_dir.name, 0) + 1
         
         return {
-            "total_files": len(all_files),
+            "total_files": total_files,
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
             "exchanges": exchange_counts,
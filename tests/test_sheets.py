@@ -0,0 +1,118 @@
+"""
+Tests for appending rows to a worksheet
+The worksheet is a stub holding its grid in memory, so no API calls are made
+"""
+import re
+import unittest
+from unittest import mock
+
+import pandas as pd
+from gspread.utils import a1_to_rowcol
+
+from config.config import REQUIRED_COLUMNS
+from drive import sheets
+
+
+def _frame(start: str, periods: int) -> pd.DataFrame:
+    """Build an OHLCV DataFrame with hourly timestamps"""
+    return pd.DataFrame({
+        "timestamp": pd.date_range(start, periods=periods, freq="h", tz="UTC"),
+        "open": 1.0,
+        "high": 2.0,
+        "low": 0.5,
+        "close": 1.5,
+        "volume": 10.0,
+        "symbol": "BTC/USD",
+    })
+
+
+class StubSpreadsheet:
+    """Spreadsheet stub applying appendCells requests to its worksheet's grid"""
+
+    def __init__(self, worksheet: "StubWorksheet"):
+        self.id = "spreadsheet-id"
+        self.worksheet = worksheet
+        self.requests = []
+
+    def batch_update(self, body):
+        for request in body["requests"]:
+            self.requests.append(request)
+            rows = [
+                [next(iter(cell["userEnteredValue"].values())) for cell in row["values"]]
+                for row in request["appendCells"]["rows"]
+            ]
+            self.worksheet.write(self.worksheet.last_used_row() + 1, rows)
+        return {}
+
+
+class StubWorksheet:
+    """Worksheet stub; appends go below the last row with data, like Sheets"""
+
+    def __init__(self, grid):
+        self.title = "H1"
+        self.id = 0
+        self.row_count = 100
+        self.col_count = len(REQUIRED_COLUMNS)
+        self.grid = [list(row) for row in grid]
+        self.spreadsheet = StubSpreadsheet(self)
+
+    def write(self, first_row: int, rows) -> None:
+        while len(self.grid) < first_row - 1 + len(rows):
+            self.grid.append([""] * self.col_count)
+        for offset, row in enumerate(rows):
+            self.grid[first_row - 1 + offset] = [str(value) for value in row]
+
+    def last_used_row(self) -> int:
+        return max((i + 1 for i, row in enumerate(self.grid) if any(row)), default=0)
+
+    def col_values(self, col: int):
+        values = [row[col - 1] if len(row) >= col else "" for row in self.grid]
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def row_values(self, row: int):
+        return self.grid[row - 1]
+
+    def get(self, range_name):
+        first_row, first_col = a1_to_rowcol(re.split(r"[!:]", range_name)[-2])
+        values = [row[first_col - 1:first_col] for row in self.grid[first_row - 1:]]
+        while values and not any(values[-1]):
+            values.pop()
+        return values
+
+
+def _batch_update(spreadsheet, body):
+    """Stand-in for sheets._batch_update that skips the HTTP request"""
+    return spreadsheet.batch_update(body)
+
+
+@mock.patch.object(sheets, "_batch_update", _batch_update)
+class PopulateEmptyTest(unittest.TestCase):
+
+    def setUp(self):
+        sheets._TIMESTAMP_CACHE.clear()
+
+    def test_empty_worksheet_is_written_in_one_request(self):
+        worksheet = StubWorksheet([REQUIRED_COLUMNS])
+
+        appended = sheets.append_ohlcv_dataframe(worksheet, _frame("2024-01-02", 3))
+
+        self.assertEqual(appended, 3)
+        self.assertEqual(len(worksheet.spreadsheet.requests), 1)
+        self.assertEqual(len(worksheet.grid), 4)
+        self.assertEqual(worksheet.grid[0], REQUIRED_COLUMNS)
+
+    def test_untimed_rows_are_not_overwritten(self):
+        untimed = ["", "9", "9", "9", "9", "9", "BTC/USD"]
+        worksheet = StubWorksheet([REQUIRED_COLUMNS, untimed])
+
+        sheets.append_ohlcv_dataframe(worksheet, _frame("2024-01-02", 3))
+
+        self.assertEqual(len(worksheet.spreadsheet.requests), 1)
+        self.assertEqual(worksheet.grid[1], untimed)
+        self.assertEqual(len(worksheet.grid), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
 """Utilities package"""
 from .logger import setup_logger
-from .exceptions import *
\ No newline at end of file
+from .exceptions import *
+from .rate_limit import TokenBucket, call_with_backoff
\ No newline at end of file
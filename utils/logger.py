@@ -1,10 +1,43 @@
 """
 Logging utility for the OHLCV ingestion system
 """
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 from config.config import LOG_FORMAT, LOG_DATE_FORMAT
 
+# Records from every logger are queued and written to the console by one
+# background thread, so fetch threads never block on (or contend for) stdout
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+
+def _start_listener() -> None:
+    """Start the console writer thread (once per process)"""
+    global _LISTENER
+    
+    with _LISTENER_LOCK:
+        if _LISTENER is not None:
+            return
+        
+        # Console handler
+        handler = logging.StreamHandler(sys.stdout)
+        
+        # Formatter
+        formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
+        handler.setFormatter(formatter)
+        
+        _LISTENER = QueueListener(_LOG_QUEUE, handler, respect_handler_level=True)
+        _LISTENER.start()
+        
+        # Write out queued records before the interpreter exits
+        atexit.register(_LISTENER.stop)
+
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
@@ -20,17 +53,20 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
+    # Records are written by this logger's own handler; passing them on to
+    # the root logger would format them again (and print them twice if the
+    # root logger is configured)
+    logger.propagate = False
+    
     # Prevent duplicate handlers
     if logger.handlers:
         return logger
     
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
+    _start_listener()
     
-    # Formatter
-    formatter = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT)
-    handler.setFormatter(formatter)
+    # Queue handler; the listener thread formats and writes the records
+    handler = QueueHandler(_LOG_QUEUE)
+    handler.setLevel(level)
     
     logger.addHandler(handler)
     
@@ -4,11 +4,41 @@ Use this instead of service account if quota issues persist
 """
 import gspread
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-import pickle
+from google.auth.transport.requests import AuthorizedSession, Request
+import requests
+from requests.adapters import HTTPAdapter
 import os
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional, Tuple
+
+from config.config import (
+    MAX_CONCURRENT_SHEET_WRITES,
+    OAUTH_REFRESH_MARGIN_SECONDS,
+    OAUTH_REFRESH_RETRY_SECONDS,
+    OAUTH_REFRESH_RETRY_MAX_SECONDS,
+)
+from utils.logger import setup_logger
+
+# orjson decodes the saved token faster; fall back to the stdlib parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Token refreshes are serialized across processes with an OS file lock
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+logger = setup_logger(__name__)
 
 # Scopes needed
 SCOPES = [
@@ -16,6 +46,127 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive',
 ]
 
+# Process-wide (client, credentials), created on first use
+_CLIENT: Optional[Tuple[gspread.Client, Credentials]] = None
+_CLIENT_LOCK = threading.Lock()
+
+# Monotonic time until which the shared client's token is known to be fresh
+_CLIENT_FRESH_UNTIL = 0.0
+
+# Pending background refresh of the credentials (see start_token_refresher)
+_REFRESH_TIMER: Optional[threading.Timer] = None
+_REFRESH_TIMER_LOCK = threading.Lock()
+
+# Saved token, and its (mtime_ns, size) when this process last read or wrote it
+TOKEN_FILE = Path('credentials/token.json')
+TOKEN_LOCK_FILE = TOKEN_FILE.with_suffix('.lock')
+_TOKEN_STAT: Optional[Tuple[int, int]] = None
+
+# Transport for token refreshes; its session keeps the connection to the
+# token endpoint alive between refreshes instead of reconnecting each time
+_AUTH_SESSION = requests.Session()
+_AUTH_REQUEST = Request(session=_AUTH_SESSION)
+
+
+def _token_stat() -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) of the token file, or None if it does not exist"""
+    try:
+        stat = os.stat(TOKEN_FILE)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_saved_credentials() -> Optional[Credentials]:
+    """
+    Load the saved token (authorized user JSON, which is parsed as plain
+    data rather than unpickled; read in a single call)
+    
+    Returns:
+        Credentials, or None if there is no readable token file
+    """
+    global _TOKEN_STAT
+    
+    _TOKEN_STAT = _token_stat()
+    if _TOKEN_STAT is None:
+        return None
+    
+    try:
+        return Credentials.from_authorized_user_info(
+            _json_loads(TOKEN_FILE.read_bytes()), SCOPES
+        )
+    except OSError:
+        return None
+    except ValueError:
+        print("⚠️  Saved credentials are unreadable, signing in again")
+        return None
+
+
+def _save_credentials(creds: Credentials) -> None:
+    """
+    Save credentials to the token file (written atomically, so readers
+    in other processes never see a partially written token)
+    
+    Args:
+        creds: Credentials to save
+    """
+    global _TOKEN_STAT
+    
+    tmp_path = TOKEN_FILE.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(creds.to_json().encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, TOKEN_FILE)
+    _TOKEN_STAT = _token_stat()
+
+
+@contextmanager
+def _token_file_lock():
+    """Hold an exclusive lock on the token lock file, shared by all processes"""
+    with open(TOKEN_LOCK_FILE, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _refresh_credentials(creds: Credentials) -> None:
+    """
+    Refresh credentials in place, at most once across processes
+    Under the token file lock, a token saved meanwhile by another process
+    (one expiring later than ours) is adopted without calling Google;
+    otherwise the credentials are refreshed and saved for the others
+    
+    Args:
+        creds: Expired (or expiring) credentials with a refresh token
+    """
+    with _token_file_lock():
+        if _token_stat() != _TOKEN_STAT:
+            saved = _load_saved_credentials()
+            if (
+                saved is not None
+                and saved.valid
+                and saved.expiry is not None
+                and (creds.expiry is None or saved.expiry > creds.expiry)
+            ):
+                creds.token = saved.token
+                creds.expiry = saved.expiry
+                return
+        
+        creds.refresh(_AUTH_REQUEST)
+        _save_credentials(creds)
+
+
 def get_oauth_credentials(credentials_file: str = 'credentials/oauth_credentials.json') -> Credentials:
     """
     Get OAuth2 credentials using user's Google account
@@ -29,19 +180,14 @@ def get_oauth_credentials(credentials_file: str = 'credentials/oauth_credentials
     Returns:
         Credentials object
     """
-    creds = None
-    token_file = Path('credentials/token.pickle')
-    
     # Check if we have saved credentials
-    if token_file.exists():
-        with open(token_file, 'rb') as token:
-            creds = pickle.load(token)
+    creds = _load_saved_credentials()
     
     # If no valid credentials, get new ones
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             print("🔄 Refreshing expired credentials...")
-            creds.refresh(Request())
+            _refresh_credentials(creds)
         else:
             print("\n🔐 OAuth2 Setup Required")
             print("=" * 60)
@@ -52,13 +198,15 @@ def get_oauth_credentials(credentials_file: str = 'credentials/oauth_credentials
             print("=" * 60)
             input("Press Enter to continue...")
             
+            # Only needed for the interactive setup, so imported here
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            
             flow = InstalledAppFlow.from_client_secrets_file(
                 credentials_file, SCOPES)
             creds = flow.run_local_server(port=0)
-        
-        # Save credentials for future use
-        with open(token_file, 'wb') as token:
-            pickle.dump(creds, token)
+            
+            # Save credentials for future use
+            _save_credentials(creds)
         
         print("✅ OAuth2 credentials saved!")
     
@@ -73,8 +221,140 @@ def connect_gsheets_oauth():
         Tuple of (gspread client, credentials)
     """
     creds = get_oauth_credentials()
-    client = gspread.authorize(creds)
+    client = build_gspread_client(creds)
+    start_token_refresher(creds)
     return client, creds
 
 
+def start_token_refresher(creds: Credentials, retry_delay: Optional[float] = None) -> None:
+    """
+    Refresh credentials in the background shortly before they expire
+    A daemon timer refreshes them in place and reschedules itself, so
+    requests do not wait for an inline refresh; failed refreshes are
+    retried with exponential backoff, and the inline refresh in
+    get_gsheets_client stays as the fallback
+    
+    Args:
+        creds: Credentials to keep fresh
+        retry_delay: Seconds until a retry of a failed refresh (default:
+                     schedule relative to the expiry)
+    """
+    global _REFRESH_TIMER
+    
+    if not creds.refresh_token:
+        return
+    
+    if retry_delay is not None:
+        delay = retry_delay
+    elif creds.expiry is not None:
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        delay = max((creds.expiry - now).total_seconds() - OAUTH_REFRESH_MARGIN_SECONDS, 0)
+    else:
+        return
+    
+    timer = threading.Timer(delay, _refresh_in_background, args=(creds, retry_delay))
+    timer.daemon = True
+    
+    with _REFRESH_TIMER_LOCK:
+        if _REFRESH_TIMER is not None:
+            _REFRESH_TIMER.cancel()
+        _REFRESH_TIMER = timer
+        timer.start()
+
+
+def _refresh_in_background(creds: Credentials, retry_delay: Optional[float]) -> None:
+    """Refresh credentials on the timer thread and schedule the next refresh"""
+    try:
+        with _CLIENT_LOCK:
+            _refresh_credentials(creds)
+    except Exception as e:
+        next_delay = min(
+            retry_delay * 2 if retry_delay else OAUTH_REFRESH_RETRY_SECONDS,
+            OAUTH_REFRESH_RETRY_MAX_SECONDS,
+        )
+        logger.warning("Background token refresh failed, retrying in %ds: %s", next_delay, e)
+        start_token_refresher(creds, retry_delay=next_delay)
+        return
+    
+    logger.info("Refreshed OAuth credentials in the background")
+    start_token_refresher(creds)
+
+
+def _fresh_until(creds: Credentials) -> float:
+    """
+    Get the monotonic time until which credentials need no expiry check
+    (the refresh margin before expiry, which is earlier than google-auth
+    itself considers them expired)
+    
+    Args:
+        creds: Credentials
+    
+    Returns:
+        Monotonic deadline (0 if already within the margin)
+    """
+    if creds.expiry is None:
+        return float("inf")
+    
+    # google-auth keeps expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    remaining = (creds.expiry - now).total_seconds() - OAUTH_REFRESH_MARGIN_SECONDS
+    return time.monotonic() + remaining if remaining > 0 else 0.0
+
+
+def get_gsheets_client() -> Tuple[gspread.Client, Credentials]:
+    """
+    Get the shared OAuth2 gspread client
+    Connects on first use; later calls reuse the same client (and its
+    pooled session) and refresh the credentials in place once expired.
+    The token file is only re-read when its stat shows another process
+    saved a new token, and the expiry is only checked once the token
+    nears its cached deadline
+    
+    Returns:
+        Tuple of (gspread client, credentials)
+    """
+    global _CLIENT, _CLIENT_FRESH_UNTIL
+    
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = connect_gsheets_oauth()
+        else:
+            if _token_stat() != _TOKEN_STAT:
+                # Adopt the token saved by another process instead of refreshing
+                saved = _load_saved_credentials()
+                if saved is not None and saved.valid:
+                    _CLIENT = (build_gspread_client(saved), saved)
+                    _CLIENT_FRESH_UNTIL = 0.0
+                    start_token_refresher(saved)
+            
+            if time.monotonic() >= _CLIENT_FRESH_UNTIL:
+                _, creds = _CLIENT
+                if creds.expired and creds.refresh_token:
+                    _refresh_credentials(creds)
+                _CLIENT_FRESH_UNTIL = _fresh_until(creds)
+        return _CLIENT
+
+
+def build_gspread_client(creds: Credentials) -> gspread.Client:
+    """
+    Build a gspread client on a pooled, keep-alive HTTPS session
+    
+    The session keeps enough pooled connections for concurrent sheet
+    writes, so parallel requests reuse open TLS connections instead of
+    opening (and discarding) a new one per call. Refreshes triggered by
+    the session share the module's token endpoint transport.
+    
+    Args:
+        creds: Google credentials
+    
+    Returns:
+        Authorized gspread client
+    """
+    session = AuthorizedSession(creds, auth_request=_AUTH_REQUEST)
+    adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_SHEET_WRITES)
+    session.mount("https://", adapter)
+    return gspread.Client(creds, session=session)
+
+
 
@@ -0,0 +1,88 @@
+"""
+Rate limiting utilities for the OHLCV ingestion system
+Token bucket limiter and retry-with-backoff for throttled API calls
+"""
+import threading
+import time
+from typing import Any, Callable
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing bursts up to capacity"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize token bucket (starts full)
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, waiting only if it is empty
+
+        Args:
+            tokens: Number of tokens to take (default: 1)
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def call_with_backoff(
+    func: Callable[..., Any],
+    *args,
+    should_retry: Callable[[Exception], bool],
+    max_attempts: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 16.0,
+    **kwargs,
+) -> Any:
+    """
+    Call a function, retrying with exponential backoff on selected errors
+
+    Args:
+        func: Function to call
+        should_retry: Predicate deciding whether an exception is retryable
+        max_attempts: Maximum number of attempts (default: 5)
+        base_delay: Delay before the first retry in seconds (default: 1.0)
+        max_delay: Maximum delay between retries in seconds (default: 16.0)
+
+    Returns:
+        Return value of func
+
+    Raises:
+        Exception: The last error if it is not retryable or attempts run out
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_attempts or not should_retry(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+            logger.warning(
+                f"Rate limited (attempt {attempt}/{max_attempts}), retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)